@@ -1,11 +1,12 @@
 """Governance: audit logging, model/prompt registries, approval workflows. No FastAPI."""
 
-from app.governance.audit_logger import AuditLogger
+from app.governance.audit_logger import AuditBatch, AuditLogger
 from app.governance.model_registry import ModelRegistry, ModelStatus
 from app.governance.prompt_registry import PromptRegistry
 from app.governance.approval_workflow import ApprovalWorkflow, ApprovalStatus
 
 __all__ = [
+    "AuditBatch",
     "AuditLogger",
     "ModelRegistry",
     "ModelStatus",
@@ -1,6 +1,7 @@
 """Immutable audit logging for regulated traceability. No FastAPI."""
 
 from datetime import datetime, timezone
+from typing import Any, Callable
 
 from app.governance.audit_models import AuditRecord
 from app.governance.audit_repository import AuditRepository
@@ -11,10 +12,13 @@ class AuditLogger:
     Writes immutable audit records via repository.
     Must include: who, what, when (UTC), why, correlation_id.
     Must NOT allow mutation. Logs structured JSON.
+    enabled=False turns the logger into a no-op (e.g. non-regulated test/dev tenants);
+    callers can check .enabled to skip building records they would only discard.
     """
 
-    def __init__(self, repository: AuditRepository) -> None:
+    def __init__(self, repository: AuditRepository, *, enabled: bool = True) -> None:
         self._repository = repository
+        self.enabled = enabled
 
     async def log_action(
         self,
@@ -28,7 +32,9 @@ class AuditLogger:
         correlation_id: str,
         metadata: dict | None,
     ) -> None:
-        """Write immutable audit record. Timestamp is UTC."""
+        """Write immutable audit record. Timestamp is UTC. No-op when disabled."""
+        if not self.enabled:
+            return
         record = AuditRecord(
             actor=actor,
             tenant_id=tenant_id,
@@ -41,3 +47,86 @@ class AuditLogger:
             timestamp_utc=datetime.now(timezone.utc),
         )
         await self._repository.save(record)  # Structured JSON stored via repository
+
+    async def log_actions_bulk(self, entries: list[dict[str, Any]]) -> None:
+        """
+        Write several audit records in one repository call when the repository supports
+        save_many; otherwise save them one by one. Entries carry log_action's keyword
+        arguments and may include timestamp_utc (defaults to now, UTC).
+        """
+        if not entries or not self.enabled:
+            return
+        now = datetime.now(timezone.utc)
+        records = [
+            AuditRecord(
+                actor=e["actor"],
+                tenant_id=e["tenant_id"],
+                action=e["action"],
+                resource_type=e["resource_type"],
+                resource_id=e["resource_id"],
+                reason=e.get("reason"),
+                correlation_id=e["correlation_id"],
+                metadata=e.get("metadata"),
+                timestamp_utc=e.get("timestamp_utc") or now,
+            )
+            for e in entries
+        ]
+        save_many = getattr(self._repository, "save_many", None)
+        if save_many is not None:
+            await save_many(records)
+            return
+        for record in records:
+            await self._repository.save(record)
+
+
+class AuditBatch:
+    """
+    Per-request audit buffer with the same log_action signature as AuditLogger.
+    Entries are timestamped when logged and written in one flush at the end of the request.
+    Pass enabled=audit_logger.enabled so nodes skip buffering when the flush would discard it.
+    """
+
+    def __init__(self, *, enabled: bool = True) -> None:
+        self._entries: list[dict[str, Any]] = []
+        self.enabled = enabled
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def log_action(
+        self,
+        *,
+        actor: str,
+        tenant_id: str,
+        action: str,
+        resource_type: str,
+        resource_id: str,
+        reason: str | None,
+        correlation_id: str,
+        metadata: dict | None,
+    ) -> None:
+        """Buffer an audit entry; nothing is written until flush(). No-op when disabled."""
+        if not self.enabled:
+            return
+        self._entries.append(
+            {
+                "actor": actor,
+                "tenant_id": tenant_id,
+                "action": action,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "reason": reason,
+                "correlation_id": correlation_id,
+                "metadata": metadata,
+                "timestamp_utc": datetime.now(timezone.utc),
+            }
+        )
+
+    def retain(self, keep: Callable[[dict[str, Any]], bool]) -> None:
+        """Drop buffered entries for which keep(entry) is false (e.g. audit sampling)."""
+        self._entries = [e for e in self._entries if keep(e)]
+
+    async def flush(self, audit_logger: AuditLogger) -> None:
+        """Write buffered entries through audit_logger in one bulk call, then clear."""
+        entries, self._entries = self._entries, []
+        await audit_logger.log_actions_bulk(entries)
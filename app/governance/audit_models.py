@@ -5,10 +5,11 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditRecord:
     """
     Immutable audit record: who, what, when (UTC), why, correlation_id.
+    Slotted: one record is written per node per request, so no per-instance __dict__.
     """
 
     actor: str
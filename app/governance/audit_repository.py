@@ -11,3 +11,8 @@ class AuditRepository(Protocol):
     async def save(self, record: AuditRecord) -> None:
         """Persist an immutable audit record. Must not allow mutation."""
         ...
+
+    # Optional: repositories may also implement
+    #     async def save_many(self, records: list[AuditRecord]) -> None
+    # to persist a batch in one call (e.g. a multi-row insert). AuditLogger.log_actions_bulk
+    # uses it when present and falls back to save() per record otherwise.
@@ -1,16 +1,41 @@
 # app/infrastructure/cache/redis_client.py
 
+import time
+import uuid
+
 import redis.asyncio as redis
 
 from app.config.settings import settings
 
 
+# Sliding-window rate limit in one round-trip: trim expired entries, add this
+# request, refresh TTL, return the window size.
+# KEYS[1]=window key; ARGV[1]=now (ms), ARGV[2]=window (ms), ARGV[3]=unique member.
+_SLIDING_WINDOW_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1] - ARGV[2])
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[3])
+redis.call('PEXPIRE', KEYS[1], ARGV[2])
+return redis.call('ZCARD', KEYS[1])
+"""
+
+# Lock release: delete KEYS[1] only if it still holds this owner's token ARGV[1].
+_DELETE_IF_VALUE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
 class RedisClient:
     def __init__(self):
         self.client = redis.from_url(
             settings.redis_url,
             decode_responses=True,
         )
+        # Script object sends EVALSHA and transparently SCRIPT LOADs on NOSCRIPT.
+        self._sliding_window = self.client.register_script(_SLIDING_WINDOW_LUA)
+        self._delete_if_value = self.client.register_script(_DELETE_IF_VALUE_LUA)
 
     async def set_idempotency_key(self, key: str, ttl: int = 3600):
         return await self.client.set(key, "1", ex=ttl, nx=True)
@@ -24,6 +49,21 @@ class RedisClient:
     async def get_cache(self, key: str):
         return await self.client.get(key)
 
+    async def mget_cache(self, keys: list[str]) -> list[str | None]:
+        """GET several keys in one MGET round trip; None for missing keys, in key order."""
+        if not keys:
+            return []
+        return await self.client.mget(keys)
+
+    async def set_cache_many(self, items: dict[str, str], ttl: int = 300):
+        """SET ... EX for several keys in one pipelined round trip (no MULTI)."""
+        if not items:
+            return
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, value, ex=ttl)
+            await pipe.execute()
+
     async def rate_limit(
         self,
         key: str,
@@ -49,10 +89,8 @@ class RedisClient:
         await self.client.delete(key)
 
     async def delete_if_value(self, key: str, value: str) -> bool:
-        """Delete key only if its value equals value (atomic). Returns True if deleted."""
-        script = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) else return 0 end"
-        result = await self.client.eval(script, 1, key, value)
-        return bool(result)
+        """Delete key only if its value equals value (atomic, single EVALSHA). Returns True if deleted."""
+        return bool(await self._delete_if_value(keys=[key], args=[value]))
 
     async def incr(self, key: str) -> int:
         """Increment key, return new value."""
@@ -61,3 +99,17 @@ class RedisClient:
     async def expire(self, key: str, seconds: int) -> None:
         """Set TTL on key."""
         await self.client.expire(key, seconds)
+
+    async def incr_window(self, key: str, window_seconds: int) -> int:
+        """Record a request in key's sliding window; return the count in the window (single EVALSHA)."""
+        now_ms = int(time.time() * 1000)
+        member = f"{now_ms}-{uuid.uuid4().hex}"
+        return int(
+            await self._sliding_window(
+                keys=[key], args=[now_ms, window_seconds * 1000, member]
+            )
+        )
+
+    async def get_current_count(self, key: str) -> int:
+        """Number of requests recorded in key's sliding window."""
+        return await self.client.zcard(key)
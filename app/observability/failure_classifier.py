@@ -37,6 +37,32 @@ class FailureCategory(str, Enum):
     UNEXPECTED_ERROR = "UNEXPECTED_ERROR"
 
 
+# Ordered rules: the first matching base class wins (order matters for subclasses
+# that match several rows, e.g. DomainValidationError before DomainError).
+_RULES: tuple[tuple[tuple[type[BaseException], ...], FailureCategory], ...] = (
+    ((DomainValidationError,), FailureCategory.VALIDATION_ERROR),
+    ((InvalidTenantError, InvalidMetadataError), FailureCategory.VALIDATION_ERROR),
+    ((RiskThresholdViolationError,), FailureCategory.HIGH_RISK),
+    ((ModelNotApprovedError, InvalidModelStateError), FailureCategory.POLICY_VIOLATION),
+    ((InvalidWorkflowStateError, InvalidStatusTransitionError), FailureCategory.WORKFLOW_ERROR),
+    ((AuthorizationError, TenantIsolationError), FailureCategory.POLICY_VIOLATION),
+    ((EncryptionError, SecurityError), FailureCategory.INFRA_ERROR),
+    ((IdempotencyConflictError, ApplicationError), FailureCategory.WORKFLOW_ERROR),
+    ((GovernanceError,), FailureCategory.POLICY_VIOLATION),
+    ((DomainError,), FailureCategory.VALIDATION_ERROR),
+)
+
+# Exception type -> category, filled on first sight of each type; the set of raised types is small.
+_CATEGORY_BY_TYPE: dict[type, FailureCategory] = {}
+
+
+def _classify_type(exc_type: type) -> FailureCategory:
+    for bases, category in _RULES:
+        if issubclass(exc_type, bases):
+            return category
+    return FailureCategory.UNEXPECTED_ERROR
+
+
 class FailureClassifier:
     """
     Classifies exceptions into FailureCategory. Integrates with MetricsCollector
@@ -45,25 +71,9 @@ class FailureClassifier:
 
     @staticmethod
     def classify(exception: BaseException) -> FailureCategory:
-        """Map exception to FailureCategory. Unknown -> UNEXPECTED_ERROR."""
-        if isinstance(exception, DomainValidationError):
-            return FailureCategory.VALIDATION_ERROR
-        if isinstance(exception, (InvalidTenantError, InvalidMetadataError)):
-            return FailureCategory.VALIDATION_ERROR
-        if isinstance(exception, RiskThresholdViolationError):
-            return FailureCategory.HIGH_RISK
-        if isinstance(exception, (ModelNotApprovedError, InvalidModelStateError)):
-            return FailureCategory.POLICY_VIOLATION
-        if isinstance(exception, (InvalidWorkflowStateError, InvalidStatusTransitionError)):
-            return FailureCategory.WORKFLOW_ERROR
-        if isinstance(exception, (AuthorizationError, TenantIsolationError)):
-            return FailureCategory.POLICY_VIOLATION
-        if isinstance(exception, (EncryptionError, SecurityError)):
-            return FailureCategory.INFRA_ERROR
-        if isinstance(exception, (IdempotencyConflictError, ApplicationError)):
-            return FailureCategory.WORKFLOW_ERROR
-        if isinstance(exception, GovernanceError):
-            return FailureCategory.POLICY_VIOLATION
-        if isinstance(exception, DomainError):
-            return FailureCategory.VALIDATION_ERROR
-        return FailureCategory.UNEXPECTED_ERROR
+        """Map exception to FailureCategory. Unknown -> UNEXPECTED_ERROR. One dict lookup per known type."""
+        exc_type = type(exception)
+        category = _CATEGORY_BY_TYPE.get(exc_type)
+        if category is None:
+            category = _CATEGORY_BY_TYPE[exc_type] = _classify_type(exc_type)
+        return category
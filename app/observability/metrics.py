@@ -1,22 +1,108 @@
 """Prometheus-style metrics collector. Thread-safe, in-memory. No real Prometheus dependency."""
 
+import json
+import math
 import threading
+from functools import lru_cache
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional: export_bytes falls back to stdlib json
+    orjson = None
+
+# Latency histogram layout: geometric buckets from 0.01 ms, each 2**(1/8) (~9%) wider than
+# the last, up to ~10^6 ms. Bucket i holds values <= _HIST_START * _HIST_FACTOR**i; the
+# last bucket also takes anything larger.
+_HIST_START = 0.01
+_HIST_FACTOR = 2 ** (1 / 8)
+_HIST_LOG_FACTOR = math.log(_HIST_FACTOR)
+_HIST_BUCKETS = 214
+_HIST_BOUNDS = tuple(_HIST_START * _HIST_FACTOR**i for i in range(_HIST_BUCKETS))
+_PERCENTILES = (50, 95, 99)
+# Histogram lock stripes (power of two; a series picks its stripe by hash of its key).
+_HIST_STRIPES = 32
+
+
+@lru_cache(maxsize=8192)
+def _label_key(name: str, label: str, value: str) -> tuple[str, str]:
+    """(name, "name:label=value"); cached so repeat series reuse one key instead of formatting."""
+    return name, f"{name}:{label}={value}"
+
+
+class _Histogram:
+    """Fixed-size latency histogram: bucket counts plus running count, sum and max."""
+
+    __slots__ = ("count", "sum", "max", "counts")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.counts = [0] * _HIST_BUCKETS
+
+    def record(self, value: float) -> None:
+        if value <= _HIST_START:
+            idx = 0
+        else:
+            idx = min(math.ceil(math.log(value / _HIST_START) / _HIST_LOG_FACTOR), _HIST_BUCKETS - 1)
+        self.counts[idx] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile, capped at the observed max."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for idx, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(_HIST_BOUNDS[idx], self.max)
+        return self.max
+
+    def export(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": {_HIST_BOUNDS[i]: n for i, n in enumerate(self.counts) if n},
+            "percentiles": {f"p{q}": self.percentile(q) for q in _PERCENTILES},
+        }
+
 
 class MetricsCollector:
     """
     In-memory Prometheus-style registry. Tracks counters and histograms.
     Thread-safe. Exposes increment, observe_latency, export_metrics.
+    Counters are sharded per thread: increment only touches the calling thread's dicts,
+    so it takes no lock; export_metrics sums the shards. Histograms are striped by
+    series key, each stripe with its own lock, so observations on different series rarely contend.
     """
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
-        # Counters: name -> value or name -> {labels_hash -> value}
-        self._counters: dict[str, float] = {}
-        self._counters_by_labels: dict[str, dict[str, float]] = {}
-        # Histograms: name -> list of observed values (for latency)
-        self._histograms: dict[str, list[float]] = {}
+        self._local = threading.local()
+        # Counter shards, one (counters, counters_by_labels) pair per thread that has incremented.
+        # counters: name -> value; counters_by_labels: (name, label key) -> value.
+        self._shards: list[tuple[dict[str, float], dict[tuple[str, str], float]]] = []
+        # Histogram stripes: (lock, series key -> fixed-size bucket histogram) (for latency)
+        self._hist_stripes: tuple[tuple[threading.Lock, dict[str, _Histogram]], ...] = tuple(
+            (threading.Lock(), {}) for _ in range(_HIST_STRIPES)
+        )
+
+    def _shard(self) -> tuple[dict[str, float], dict[tuple[str, str], float]]:
+        """Return the calling thread's counter shard; registered under the lock on first use."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: tuple[dict[str, float], dict[tuple[str, str], float]] = ({}, {})
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
 
     def increment(
         self,
@@ -27,19 +113,15 @@ class MetricsCollector:
         category: str | None = None,
     ) -> None:
         """Increment a counter. Optional tenant_id or category for dimensional metrics."""
-        with self._lock:
-            if tenant_id is not None:
-                key = f"{name}:tenant={tenant_id}"
-                self._counters_by_labels.setdefault(name, {})[key] = (
-                    self._counters_by_labels.get(name, {}).get(key, 0) + value
-                )
-            elif category is not None:
-                key = f"{name}:category={category}"
-                self._counters_by_labels.setdefault(name, {})[key] = (
-                    self._counters_by_labels.get(name, {}).get(key, 0) + value
-                )
-            else:
-                self._counters[name] = self._counters.get(name, 0) + value
+        counters, by_labels = self._shard()
+        if tenant_id is not None:
+            key = _label_key(name, "tenant", tenant_id)
+            by_labels[key] = by_labels.get(key, 0) + value
+        elif category is not None:
+            key = _label_key(name, "category", category)
+            by_labels[key] = by_labels.get(key, 0) + value
+        else:
+            counters[name] = counters.get(name, 0) + value
 
     def observe_latency(
         self,
@@ -49,34 +131,53 @@ class MetricsCollector:
         node: str | None = None,
     ) -> None:
         """Record a latency observation (histogram-style). Optional node label."""
-        with self._lock:
-            bucket = f"{name}" if node is None else f"{name}:node={node}"
-            if bucket not in self._histograms:
-                self._histograms[bucket] = []
-            self._histograms[bucket].append(latency_ms)
+        bucket = name if node is None else _label_key(name, "node", node)[1]
+        lock, histograms = self._hist_stripes[hash(bucket) & (_HIST_STRIPES - 1)]
+        with lock:
+            hist = histograms.get(bucket)
+            if hist is None:
+                hist = histograms[bucket] = _Histogram()
+            hist.record(latency_ms)
 
     def export_metrics(self) -> dict[str, Any]:
         """Export all metrics as a dict (simulated Prometheus-style)."""
         with self._lock:
-            out: dict[str, Any] = {
-                "counters": dict(self._counters),
-                "counters_by_labels": {
-                    k: dict(v) for k, v in self._counters_by_labels.items()
-                },
-                "histograms": {
-                    k: {
-                        "count": len(v),
-                        "sum": sum(v),
-                        "values": v,
-                    }
-                    for k, v in self._histograms.items()
-                },
-            }
-            return out
+            # dict() copies each shard in one C call, so a concurrent increment cannot
+            # resize it mid-iteration.
+            shards = [(dict(c), dict(b)) for c, b in self._shards]
+        # Stripes are snapshotted one at a time; each series is consistent on its own.
+        histograms: dict[str, Any] = {}
+        for lock, stripe in self._hist_stripes:
+            with lock:
+                histograms.update((k, h.export()) for k, h in stripe.items())
+        counters: dict[str, float] = {}
+        counters_by_labels: dict[str, dict[str, float]] = {}
+        for shard_counters, shard_by_labels in shards:
+            for name, value in shard_counters.items():
+                counters[name] = counters.get(name, 0) + value
+            for (name, key), value in shard_by_labels.items():
+                labels = counters_by_labels.setdefault(name, {})
+                labels[key] = labels.get(key, 0) + value
+        return {
+            "counters": counters,
+            "counters_by_labels": counters_by_labels,
+            "histograms": histograms,
+        }
+
+    def export_bytes(self) -> bytes:
+        """export_metrics() as compact JSON bytes, for a metrics endpoint. Uses orjson when installed."""
+        data = self.export_metrics()
+        if orjson is not None:
+            # Histogram bucket keys are floats; stdlib json stringifies them the same way.
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
 
     def reset(self) -> None:
         """Reset all metrics (for tests)."""
         with self._lock:
-            self._counters.clear()
-            self._counters_by_labels.clear()
-            self._histograms.clear()
+            for counters, by_labels in self._shards:
+                counters.clear()
+                by_labels.clear()
+        for lock, stripe in self._hist_stripes:
+            with lock:
+                stripe.clear()
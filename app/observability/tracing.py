@@ -1,34 +1,69 @@
 """OpenTelemetry-style tracing. In-memory exporter. Async-compatible."""
 
+import time
 import uuid
+import zlib
+from collections import deque
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import AsyncContextManager
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from app.observability.metrics import MetricsCollector
 
-@dataclass
+DEFAULT_MAX_TRACES = 10_000
+
+
+def should_sample(key: str, rate: float) -> bool:
+    """
+    Head-based sampling decision. Deterministic per key (e.g. correlation_id), so a
+    retried request gets the same decision. rate >= 1 always samples; rate <= 0 never does.
+    """
+    if rate >= 1.0:
+        return True
+    if rate <= 0.0:
+        return False
+    return zlib.crc32(key.encode("utf-8")) / 0xFFFFFFFF < rate
+
+
+@dataclass(slots=True)
 class Span:
-    """Single span with timing and attributes."""
+    """
+    Single span with timing and attributes. Duration comes from the monotonic
+    perf_counter_ns pair; end_time_utc is derived from it on access.
+    Slotted: no per-instance __dict__, so each span is one smaller allocation.
+    """
 
     span_id: str
     trace_id: str
     name: str
     parent_span_id: str | None
     start_time_utc: datetime
-    end_time_utc: datetime | None = None
     attributes: dict[str, Any] = field(default_factory=dict)
+    _start_ns: int = field(default=0, init=False, repr=False)
+    _end_ns: int | None = field(default=None, init=False, repr=False)
 
     @property
     def duration_ms(self) -> float | None:
-        if self.end_time_utc is None:
+        if self._end_ns is None:
             return None
-        delta = self.end_time_utc - self.start_time_utc
-        return delta.total_seconds() * 1000
+        return (self._end_ns - self._start_ns) / 1_000_000
 
+    @property
+    def end_time_utc(self) -> datetime | None:
+        if self._end_ns is None:
+            return None
+        return self.start_time_utc + timedelta(microseconds=(self._end_ns - self._start_ns) / 1000)
+
+
+# Innermost open span in the current task/context; asyncio tasks inherit a copy.
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
 
-@dataclass
+
+@dataclass(slots=True)
 class Trace:
     """Trace with root span and children."""
 
@@ -46,13 +81,20 @@ class TracingService:
     """
     In-memory tracing. start_span/end_span with trace ID propagation,
     span hierarchy (workflow → nodes), latency, and metadata.
-    No real OTLP export.
+    No real OTLP export. Keeps at most max_traces traces (ring buffer): the oldest is
+    evicted when a new trace starts, counted in dropped_traces and traces_dropped_count.
     """
 
-    def __init__(self) -> None:
-        self._traces: list[Trace] = []
+    def __init__(
+        self,
+        max_traces: int = DEFAULT_MAX_TRACES,
+        metrics_collector: "MetricsCollector | None" = None,
+    ) -> None:
+        self._traces: deque[Trace] = deque(maxlen=max_traces)
+        self._traces_by_id: dict[str, Trace] = {}
+        self._metrics = metrics_collector
+        self.dropped_traces = 0
         self._active_spans: dict[str, Span] = {}  # span_id -> span
-        self._span_stack: list[str] = []  # current span chain for nesting
 
     def _now_utc(self) -> datetime:
         return datetime.now(timezone.utc)
@@ -70,9 +112,17 @@ class TracingService:
         prompt_version: int | None = None,
     ) -> AsyncContextManager[Span]:
         """
-        Start a span. If trace_id is None, create a new trace. Returns the span; on exit, end the span.
+        Start a span. Returns the span; on exit, end the span. trace_id and parent_span_id
+        default to the enclosing span of this service in the current context; with no
+        enclosing span and no trace_id, a new trace is created.
         """
         span_id = str(uuid.uuid4())
+        parent = _current_span.get()
+        if parent is not None and self._active_spans.get(parent.span_id) is parent:
+            if trace_id is None:
+                trace_id = parent.trace_id
+            if parent_span_id is None and trace_id == parent.trace_id:
+                parent_span_id = parent.span_id
         if trace_id is None:
             trace_id = str(uuid.uuid4())
         start = self._now_utc()
@@ -94,33 +144,48 @@ class TracingService:
             start_time_utc=start,
             attributes=attrs,
         )
+        span._start_ns = time.perf_counter_ns()
         self._active_spans[span_id] = span
-        self._span_stack.append(span_id)
 
         # Ensure we have a trace for this trace_id
-        existing = next((t for t in self._traces if t.trace_id == trace_id), None)
+        existing = self._traces_by_id.get(trace_id)
         if existing is None:
             existing = Trace(trace_id=trace_id)
-            self._traces.append(existing)
+            self._add_trace(existing)
         existing.spans.append(span)
 
+        token = _current_span.set(span)
         try:
             yield span
         finally:
-            span.end_time_utc = self._now_utc()
-            if self._span_stack and self._span_stack[-1] == span_id:
-                self._span_stack.pop()
+            span._end_ns = time.perf_counter_ns()
+            _current_span.reset(token)
             self._active_spans.pop(span_id, None)
 
+    def _add_trace(self, trace: Trace) -> None:
+        """Append a trace, evicting (and counting) the oldest when the buffer is full."""
+        if len(self._traces) == self._traces.maxlen:
+            evicted = self._traces[0]
+            self._traces_by_id.pop(evicted.trace_id, None)
+            self.dropped_traces += 1
+            if self._metrics:
+                self._metrics.increment("traces_dropped_count")
+        self._traces.append(trace)
+        self._traces_by_id[trace.trace_id] = trace
+
+    def should_sample(self, key: str, rate: float) -> bool:
+        """Head-based sampling decision for a request; see module-level should_sample."""
+        return should_sample(key, rate)
+
     def get_traces(self) -> list[Trace]:
         """Return all stored traces (for tests/export)."""
         return list(self._traces)
 
     def get_trace(self, trace_id: str) -> Trace | None:
-        return next((t for t in self._traces if t.trace_id == trace_id), None)
+        return self._traces_by_id.get(trace_id)
 
     def reset(self) -> None:
         """Clear stored traces (for tests)."""
         self._traces.clear()
+        self._traces_by_id.clear()
         self._active_spans.clear()
-        self._span_stack.clear()
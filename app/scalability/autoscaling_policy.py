@@ -55,24 +55,21 @@ class AutoScalingPolicy:
     def evaluate(self, metrics: MetricsSnapshot) -> ScalingDecision:
         """Fully deterministic. Prefer scale-up on any breach; scale-down only when all low."""
         m = metrics
-        # Scale-up conditions (any can trigger)
-        if m.cpu_usage_pct is not None and m.cpu_usage_pct >= self._cpu_up:
-            if m.current_replicas < self._max_replicas:
+        # Scale-up conditions (any can trigger); none apply once at max_replicas.
+        if m.current_replicas < self._max_replicas:
+            if m.cpu_usage_pct is not None and m.cpu_usage_pct >= self._cpu_up:
                 return ScalingDecision(ScalingAction.SCALE_UP, f"cpu_usage={m.cpu_usage_pct}% >= {self._cpu_up}%")
-        if m.request_latency_p99_ms is not None and m.request_latency_p99_ms >= self._latency_up:
-            if m.current_replicas < self._max_replicas:
+            if m.request_latency_p99_ms is not None and m.request_latency_p99_ms >= self._latency_up:
                 return ScalingDecision(
                     ScalingAction.SCALE_UP,
                     f"latency_p99={m.request_latency_p99_ms}ms >= {self._latency_up}ms",
                 )
-        if m.failure_rate is not None and m.failure_rate >= self._failure_up:
-            if m.current_replicas < self._max_replicas:
+            if m.failure_rate is not None and m.failure_rate >= self._failure_up:
                 return ScalingDecision(
                     ScalingAction.SCALE_UP,
                     f"failure_rate={m.failure_rate} >= {self._failure_up}",
                 )
-        if m.queue_depth is not None and m.queue_depth >= self._queue_up:
-            if m.current_replicas < self._max_replicas:
+            if m.queue_depth is not None and m.queue_depth >= self._queue_up:
                 return ScalingDecision(
                     ScalingAction.SCALE_UP,
                     f"queue_depth={m.queue_depth} >= {self._queue_up}",
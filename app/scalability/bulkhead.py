@@ -8,8 +8,11 @@ T = TypeVar("T")
 
 class BulkheadExecutor:
     """
-    Limits max concurrent tasks. Bounded queue for waiting; overflow raises.
-    Async-safe. Prevents tenant starvation by capping concurrency and queue.
+    Limits max concurrent tasks. Bounded number of waiters; overflow raises.
+    Async-safe: an explicit active counter guarded by asyncio.Condition, so the
+    limit can be resized at runtime via set_max_concurrent. When a slot is free and
+    nobody is waiting, acquire and release only touch the counter (no await; the
+    event loop runs them without interleaving); the Condition is used only to wait.
     """
 
     def __init__(
@@ -17,39 +20,45 @@ class BulkheadExecutor:
         max_concurrent: int = 10,
         max_queued: int = 100,
     ) -> None:
-        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._cond = asyncio.Condition()
         self._max_concurrent = max_concurrent
         self._max_queued = max_queued
-        self._queue: asyncio.Queue[tuple[asyncio.Future[T], Callable[..., Awaitable[T]], tuple[Any, ...], dict[str, Any]]] = asyncio.Queue(maxsize=max_queued)
         self._active = 0
-        self._lock = asyncio.Lock()
-        self._worker: asyncio.Task[None] | None = None
+        self._waiting = 0
 
     @property
     def active_count(self) -> int:
         return self._active
 
-    def _ensure_worker(self) -> None:
-        if self._worker is None or self._worker.done():
-            self._worker = asyncio.create_task(self._run_worker())
+    @property
+    def queued_count(self) -> int:
+        return self._waiting
+
+    async def set_max_concurrent(self, max_concurrent: int) -> None:
+        """Resize the concurrency limit; waiters are woken if capacity grew."""
+        async with self._cond:
+            self._max_concurrent = max_concurrent
+            self._cond.notify_all()
+
+    async def _acquire(self) -> None:
+        if self._active < self._max_concurrent and not self._waiting:
+            self._active += 1
+            return
+        if self._active >= self._max_concurrent and self._waiting >= self._max_queued:
+            raise RuntimeError("Bulkhead: max concurrent and queue full")
+        self._waiting += 1
+        try:
+            async with self._cond:
+                await self._cond.wait_for(lambda: self._active < self._max_concurrent)
+                self._active += 1
+        finally:
+            self._waiting -= 1
 
-    async def _run_worker(self) -> None:
-        while True:
-            future, task, args, kwargs = await self._queue.get()
-            try:
-                async with self._semaphore:
-                    async with self._lock:
-                        self._active += 1
-                    try:
-                        result = await task(*args, **kwargs)
-                        if not future.done():
-                            future.set_result(result)
-                    finally:
-                        async with self._lock:
-                            self._active -= 1
-            except Exception as e:
-                if not future.done():
-                    future.set_exception(e)
+    async def _release(self) -> None:
+        self._active -= 1
+        if self._waiting:
+            async with self._cond:
+                self._cond.notify(1)
 
     async def submit(
         self,
@@ -58,13 +67,11 @@ class BulkheadExecutor:
         **kwargs: Any,
     ) -> T:
         """
-        Run task with bulkhead limit. If queue is full, raise. Otherwise enqueue and return when done.
+        Run task with bulkhead limit. If all slots and the wait queue are full, raise.
+        Otherwise wait for a slot and return the task's result.
         """
-        self._ensure_worker()
-        loop = asyncio.get_running_loop()
-        future = loop.create_future()
+        await self._acquire()
         try:
-            self._queue.put_nowait((future, task, args, kwargs))
-        except asyncio.QueueFull:
-            raise RuntimeError("Bulkhead: max concurrent and queue full") from None
-        return await future
+            return await task(*args, **kwargs)
+        finally:
+            await self._release()
@@ -1,7 +1,8 @@
-"""Circuit breaker pattern: CLOSED, OPEN, HALF_OPEN. Failure threshold and recovery timeout. Metrics tracking."""
+"""Circuit breaker pattern: CLOSED, OPEN, HALF_OPEN. Sliding failure window and recovery timeout. Metrics tracking."""
 
-import asyncio
+import random
 import time
+from collections import deque
 from enum import Enum
 from typing import Any, Awaitable, Callable, TypeVar
 
@@ -12,12 +13,21 @@ class CircuitState(str, Enum):
     CLOSED = "closed"
     OPEN = "open"
     HALF_OPEN = "half_open"
+    RECOVERING = "recovering"
 
 
 class CircuitBreaker:
     """
-    Circuit breaker: after failure_threshold failures, open for recovery_timeout_seconds,
-    then half-open for one probe. Thread-safe and async-safe via asyncio.Lock.
+    Circuit breaker: opens when, within the last window_seconds, at least
+    failure_threshold calls failed and the failure rate is >= failure_rate_threshold.
+    Stays open for a cooldown (recovery_timeout_seconds, doubled after each failed
+    probe up to max_recovery_timeout_seconds), then half-open for one probe.
+    With recovery_admit_ratio < 1, a successful probe moves to RECOVERING: only that
+    fraction of calls is admitted, growing 1.5x per success until CLOSED.
+    Lock-free: asyncio runs callers on one thread and (state, last_failure_time) is
+    swapped as a single tuple, so there is no await between reading and writing it.
+    A call that finishes after the state moved on (e.g. admitted while CLOSED, done while
+    HALF_OPEN) only feeds the failure window; it never counts as the probe.
     """
 
     def __init__(
@@ -26,33 +36,88 @@ class CircuitBreaker:
         recovery_timeout_seconds: float = 30.0,
         name: str = "default",
         metrics_callback: Any = None,
+        window_seconds: float = 60.0,
+        failure_rate_threshold: float = 0.5,
+        max_recovery_timeout_seconds: float | None = None,
+        recovery_admit_ratio: float = 1.0,
     ) -> None:
         self._threshold = failure_threshold
         self._recovery_timeout = recovery_timeout_seconds
+        # Cooldown doubles after each failed half-open probe, up to the cap; resets on success.
+        self._max_cooldown = (
+            max_recovery_timeout_seconds
+            if max_recovery_timeout_seconds is not None
+            else recovery_timeout_seconds * 32
+        )
+        self._current_cooldown = recovery_timeout_seconds
         self._name = name
         self._metrics = metrics_callback
-        self._state = CircuitState.CLOSED
-        self._failures = 0
-        self._last_failure_time: float | None = None
-        self._lock = asyncio.Lock()
+        self._window = window_seconds
+        self._rate_threshold = failure_rate_threshold
+        self._state_ts: tuple[CircuitState, float | None] = (CircuitState.CLOSED, None)
+        # (monotonic ts, success) per call inside the window; failures counted alongside.
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._window_failures = 0
+        self._probe_inflight = False
+        self._recovery_admit = recovery_admit_ratio
+        self._admit_prob = 1.0
 
     @property
     def state(self) -> CircuitState:
-        return self._state
+        return self._state_ts[0]
 
-    def _record_success(self) -> None:
-        self._failures = 0
-        self._state = CircuitState.CLOSED
+    def _trim(self, now: float) -> None:
+        """Drop outcomes older than the window."""
+        cutoff = now - self._window
+        outcomes = self._outcomes
+        while outcomes and outcomes[0][0] < cutoff:
+            _, ok = outcomes.popleft()
+            if not ok:
+                self._window_failures -= 1
+
+    def _record_success(self, admitted: CircuitState) -> None:
+        """admitted: state the call was let in under; only such calls drive recovery."""
+        state = self._state_ts[0]
+        if admitted is state and (state == CircuitState.HALF_OPEN or state == CircuitState.RECOVERING):
+            if state == CircuitState.HALF_OPEN:
+                self._admit_prob = self._recovery_admit
+            else:
+                self._admit_prob = min(1.0, self._admit_prob * 1.5)
+            if self._admit_prob >= 1.0:
+                self._outcomes.clear()
+                self._window_failures = 0
+                self._current_cooldown = self._recovery_timeout
+                state = CircuitState.CLOSED
+            else:
+                state = CircuitState.RECOVERING
+            self._state_ts = (state, self._state_ts[1])
+        else:
+            # CLOSED, or a call admitted under an earlier state: window only, state tuple untouched.
+            now = time.monotonic()
+            self._trim(now)
+            self._outcomes.append((now, True))
         if self._metrics and hasattr(self._metrics, "increment"):
             self._metrics.increment("circuit_breaker_success", 1, category=self._name)
 
-    def _record_failure(self) -> None:
-        self._last_failure_time = time.monotonic()
-        self._failures += 1
+    def _record_failure(self, admitted: CircuitState) -> None:
+        """admitted: state the call was let in under; a stale failure only feeds the window."""
+        now = time.monotonic()
+        self._trim(now)
+        self._outcomes.append((now, False))
+        self._window_failures += 1
+        state = self._state_ts[0]
+        if admitted is state:
+            if state == CircuitState.HALF_OPEN or state == CircuitState.RECOVERING:
+                self._current_cooldown = min(self._current_cooldown * 2, self._max_cooldown)
+                state = CircuitState.OPEN
+            elif (
+                self._window_failures >= self._threshold
+                and self._window_failures >= self._rate_threshold * len(self._outcomes)
+            ):
+                state = CircuitState.OPEN
+            self._state_ts = (state, now)
         if self._metrics and hasattr(self._metrics, "increment"):
             self._metrics.increment("circuit_breaker_failure", 1, category=self._name)
-        if self._failures >= self._threshold:
-            self._state = CircuitState.OPEN
 
     async def call(
         self,
@@ -60,25 +125,31 @@ class CircuitBreaker:
         *args: Any,
         **kwargs: Any,
     ) -> T:
-        """Execute func through the circuit. Raises if circuit is OPEN; on failure counts and may open."""
-        async with self._lock:
-            if self._state == CircuitState.OPEN:
-                if self._last_failure_time is not None:
-                    if time.monotonic() - self._last_failure_time >= self._recovery_timeout:
-                        self._state = CircuitState.HALF_OPEN
-                    else:
-                        raise RuntimeError(f"Circuit breaker {self._name} is OPEN")
-                else:
-                    raise RuntimeError(f"Circuit breaker {self._name} is OPEN")
-            # CLOSED or HALF_OPEN: try the call
+        """Execute func through the circuit. Raises if circuit is OPEN; on failure records and may open."""
+        state, last_failure = self._state_ts
+        probe = False
+        if state == CircuitState.OPEN:
+            if (
+                last_failure is None
+                or time.monotonic() - last_failure < self._current_cooldown
+            ):
+                raise RuntimeError(f"Circuit breaker {self._name} is OPEN")
+            self._state_ts = (CircuitState.HALF_OPEN, last_failure)
+            state = CircuitState.HALF_OPEN
+        if state == CircuitState.HALF_OPEN:
+            # Exactly one probe; everyone else fails fast until it settles.
+            if self._probe_inflight:
+                raise RuntimeError(f"Circuit breaker {self._name} is HALF_OPEN (probing)")
+            self._probe_inflight = probe = True
+        elif state == CircuitState.RECOVERING and random.random() >= self._admit_prob:
+            raise RuntimeError(f"Circuit breaker {self._name} is RECOVERING")
         try:
             result = await func(*args, **kwargs)
-            async with self._lock:
-                self._record_success()
-            return result
         except Exception:
-            async with self._lock:
-                self._record_failure()
-                if self._state == CircuitState.HALF_OPEN:
-                    self._state = CircuitState.OPEN
+            self._record_failure(state)
             raise
+        finally:
+            if probe:
+                self._probe_inflight = False
+        self._record_success(state)
+        return result
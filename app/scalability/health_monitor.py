@@ -1,12 +1,20 @@
 """Aggregate system health: DB, Redis, RabbitMQ, workflow backlog, circuit breaker states, node latency. Integrates with observability."""
 
+import asyncio
+import copy
+import time
 from typing import Any, Awaitable, Callable
 
+DEFAULT_CACHE_TTL_SECONDS = 1.0
+
 
 class HealthMonitor:
     """
     Aggregates health checks. All backends injected; no global state.
-    Returns dict with status per component and overall.
+    Returns dict with status per component and overall. The last result is served for
+    cache_ttl_seconds (0 disables caching); concurrent callers during a refresh share
+    one run of the checks, so a busy health endpoint does not multiply backend queries.
+    Each caller gets its own deep copy of the report, so mutating it never leaks into the cache.
     """
 
     def __init__(
@@ -17,6 +25,7 @@ class HealthMonitor:
         workflow_backlog: Callable[[], Awaitable[int]] | None = None,
         circuit_breaker_states: Callable[[], dict[str, str]] | None = None,
         node_latency_metrics: Callable[[], dict[str, Any]] | None = None,
+        cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
     ) -> None:
         self._db = db_health
         self._redis = redis_health
@@ -24,9 +33,29 @@ class HealthMonitor:
         self._backlog = workflow_backlog
         self._circuit_states = circuit_breaker_states
         self._latency = node_latency_metrics
+        self._cache_ttl = cache_ttl_seconds
+        self._cached: tuple[float, dict[str, Any]] | None = None
+        self._inflight: asyncio.Future[dict[str, Any]] | None = None
 
     async def system_health(self) -> dict[str, Any]:
         """Return aggregated health: db, redis, rabbitmq, workflow_backlog, circuit_breakers, node_latency."""
+        cached = self._cached
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return copy.deepcopy(cached[1])
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._refresh())
+        # shield: a cancelled caller must not cancel the refresh other callers are waiting on.
+        return copy.deepcopy(await asyncio.shield(self._inflight))
+
+    async def _refresh(self) -> dict[str, Any]:
+        try:
+            out = await self._run_checks()
+            self._cached = (time.monotonic(), out)
+            return out
+        finally:
+            self._inflight = None
+
+    async def _run_checks(self) -> dict[str, Any]:
         out: dict[str, Any] = {
             "db": {"status": "unknown"},
             "redis": {"status": "unknown"},
@@ -36,30 +65,26 @@ class HealthMonitor:
             "node_latency_metrics": {},
             "status": "ok",
         }
-        if self._db:
-            try:
-                out["db"] = await self._db()
-            except Exception as e:
-                out["db"] = {"status": "error", "error": str(e)}
-                out["status"] = "degraded"
-        if self._redis:
-            try:
-                out["redis"] = await self._redis()
-            except Exception as e:
-                out["redis"] = {"status": "error", "error": str(e)}
-                out["status"] = "degraded"
-        if self._rabbitmq:
-            try:
-                out["rabbitmq"] = await self._rabbitmq()
-            except Exception as e:
-                out["rabbitmq"] = {"status": "error", "error": str(e)}
-                out["status"] = "degraded"
-        if self._backlog:
-            try:
-                out["workflow_backlog"] = await self._backlog()
-            except Exception as e:
-                out["workflow_backlog"] = None
+        # Async checks run concurrently: total latency is the slowest check, not the sum.
+        checks = [
+            (key, fn)
+            for key, fn in (
+                ("db", self._db),
+                ("redis", self._redis),
+                ("rabbitmq", self._rabbitmq),
+                ("workflow_backlog", self._backlog),
+            )
+            if fn is not None
+        ]
+        results = await asyncio.gather(*(fn() for _, fn in checks), return_exceptions=True)
+        for (key, _), result in zip(checks, results):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result  # cancellation etc. propagates as before
+            if isinstance(result, Exception):
+                out[key] = None if key == "workflow_backlog" else {"status": "error", "error": str(result)}
                 out["status"] = "degraded"
+            else:
+                out[key] = result
         if self._circuit_states:
             try:
                 out["circuit_breaker_states"] = self._circuit_states()
@@ -1,6 +1,7 @@
 """Per-tenant token-bucket / sliding-window rate limiter. Metrics-integrated."""
 
 import time
+from collections import deque
 from typing import Any, Protocol
 
 
@@ -12,23 +13,29 @@ class RateLimitBackend(Protocol):
 
 
 class InMemoryRateLimitBackend:
-    """In-memory sliding window: key -> list of timestamps. For tests or single-node."""
+    """
+    In-memory sliding window: key -> deque of monotonic timestamps, oldest first.
+    Expired entries are popped from the front, so each call is amortised O(1).
+    For tests or single-node; single-thread async is safe without a lock.
+    """
 
     def __init__(self) -> None:
-        self._windows: dict[str, list[float]] = {}
-        self._lock = None  # optional asyncio lock if needed; single-thread async is safe
+        self._windows: dict[str, deque[float]] = {}
 
     async def incr_window(self, key: str, window_seconds: int) -> int:
         now = time.monotonic()
         cutoff = now - window_seconds
-        if key not in self._windows:
-            self._windows[key] = []
-        self._windows[key] = [t for t in self._windows[key] if t > cutoff]
-        self._windows[key].append(now)
-        return len(self._windows[key])
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = deque()
+        while window and window[0] <= cutoff:
+            window.popleft()
+        window.append(now)
+        return len(window)
 
     async def get_current_count(self, key: str) -> int:
-        return len(self._windows.get(key, []))
+        window = self._windows.get(key)
+        return len(window) if window is not None else 0
 
 
 class TenantRateLimiter:
@@ -1,6 +1,13 @@
 """Tenant-aware workload partitioning. Consistent hashing, stable partition mapping."""
 
 import hashlib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=65536)
+def _tenant_hash(tenant_id: str) -> int:
+    """sha256 of tenant_id as an int. Cached: the tenant set is small and lookups repeat per request."""
+    return int.from_bytes(hashlib.sha256(tenant_id.encode("utf-8")).digest(), "big")
 
 
 class WorkloadPartitioner:
@@ -16,5 +23,4 @@ class WorkloadPartitioner:
 
     def get_partition(self, tenant_id: str) -> int:
         """Return partition index in [0, num_partitions - 1]. Stable for same tenant_id."""
-        h = hashlib.sha256(tenant_id.encode("utf-8")).hexdigest()
-        return int(h, 16) % self._num_partitions
+        return _tenant_hash(tenant_id) % self._num_partitions
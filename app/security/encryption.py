@@ -1,63 +1,131 @@
 """AES-based encryption wrapper. Use env key; fail if key missing. No global state."""
 
 import base64
+import binascii
 import os
+from functools import lru_cache
 from typing import Optional
 
-from cryptography.fernet import Fernet, InvalidToken
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from app.security.exceptions import EncryptionError
 
-# Fernet uses AES-128-CBC; we derive a key from the raw secret if needed.
+# AES-256-GCM with a 32-byte key; we derive a key from the raw secret if needed.
 DEFAULT_SALT = b"ai_risk_engine_encryption_v1"
+DEFAULT_ITERATIONS = 480000
+NONCE_SIZE = 12
+# Ciphertext layout (before base64): version byte | 12-byte nonce | GCM ciphertext+tag.
+_GCM_VERSION = 0x02
+# Legacy Fernet tokens start with version byte 0x80 ("gA" in base64). Older
+# ciphertexts were base64-wrapped a second time and decode to b"gA...".
+_FERNET_VERSION = 0x80
+_FERNET_TOKEN_PREFIX = b"gA"
 
 
-def _derive_key(secret: str, salt: bytes = DEFAULT_SALT) -> bytes:
-    """Derive a 32-byte key for Fernet from a variable-length secret."""
+@lru_cache(maxsize=8)
+def _derive_key(
+    secret: str, salt: bytes = DEFAULT_SALT, iterations: int = DEFAULT_ITERATIONS
+) -> bytes:
+    """Derive a 32-byte key from a variable-length secret. Cached per (secret, salt, iterations)."""
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=32,
         salt=salt,
-        iterations=480000,
+        iterations=iterations,
     )
-    return base64.urlsafe_b64encode(kdf.derive(secret.encode("utf-8")))
+    return kdf.derive(secret.encode("utf-8"))
+
+
+def _as_raw_key(raw: str) -> Optional[bytes]:
+    """Return decoded key bytes if raw is already a urlsafe-b64 32-byte key, else None."""
+    if len(raw) != 44:
+        return None
+    try:
+        decoded = base64.b64decode(raw, altchars=b"-_", validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return decoded if len(decoded) == 32 else None
 
 
 class EncryptionService:
     """
-    AES-based encryption (Fernet). Use environment key; fail if key missing.
+    AES-256-GCM authenticated encryption. Use environment key; fail if key missing.
     No global state — key is passed in (from env in production).
     """
 
-    def __init__(self, key: Optional[str] = None) -> None:
+    def __init__(
+        self, key: Optional[str] = None, iterations: int = DEFAULT_ITERATIONS
+    ) -> None:
         """
         key: raw secret (e.g. from ENCRYPTION_KEY env). If None/empty, read from
         os.environ["ENCRYPTION_KEY"]. Raises EncryptionError if key missing.
+        A ready-made key (urlsafe-b64, 32 bytes) is used as-is for AES-GCM; any other
+        secret goes through PBKDF2 with the given iterations. Legacy Fernet tokens are
+        always read with the PBKDF2-derived key, see _legacy_fernet.
         """
         raw = key or os.environ.get("ENCRYPTION_KEY")
         if not raw or not raw.strip():
             raise EncryptionError(
                 "Encryption key is required. Set ENCRYPTION_KEY in environment."
             )
-        self._fernet = Fernet(_derive_key(raw.strip()))
+        raw = raw.strip()
+        ready_key = _as_raw_key(raw)
+        key_bytes = ready_key if ready_key is not None else _derive_key(raw, DEFAULT_SALT, iterations)
+        self._aead = AESGCM(key_bytes)
+        self._secret = raw
+        self._iterations = iterations
+        self._ready_key = ready_key
+        self._fernet: Optional[MultiFernet] = None
+
+    def _legacy_fernet(self) -> MultiFernet:
+        """
+        Fernet for tokens written before the GCM switch, built on first use. Those tokens were
+        always keyed with PBKDF2(secret), including for ready-made keys, so a ready-made key
+        needs the derivation here (and keeps the raw key as a second candidate).
+        """
+        if self._fernet is None:
+            derived = _derive_key(self._secret, DEFAULT_SALT, self._iterations)
+            keys = [Fernet(base64.urlsafe_b64encode(derived))]
+            if self._ready_key is not None:
+                keys.append(Fernet(base64.urlsafe_b64encode(self._ready_key)))
+            self._fernet = MultiFernet(keys)
+        return self._fernet
 
     def encrypt(self, data: str) -> str:
-        """Encrypt string; return base64-encoded ciphertext."""
+        """Encrypt string; return urlsafe-base64 of version | nonce | ciphertext."""
         try:
-            encrypted = self._fernet.encrypt(data.encode("utf-8"))
-            return base64.urlsafe_b64encode(encrypted).decode("ascii")
+            nonce = os.urandom(NONCE_SIZE)
+            sealed = self._aead.encrypt(nonce, data.encode("utf-8"), None)
+            return base64.urlsafe_b64encode(
+                bytes((_GCM_VERSION,)) + nonce + sealed
+            ).decode("ascii")
         except Exception as e:
             raise EncryptionError(f"Encryption failed: {e}") from e
 
     def decrypt(self, data: str) -> str:
-        """Decrypt base64-encoded ciphertext. Raises EncryptionError if wrong key/corrupt."""
+        """
+        Decrypt ciphertext from encrypt(). Raises EncryptionError if wrong key/corrupt.
+        Legacy Fernet tokens (single or double base64) are still accepted.
+        """
         try:
-            raw = base64.urlsafe_b64decode(data.encode("ascii"))
-            decrypted = self._fernet.decrypt(raw)
+            blob = base64.urlsafe_b64decode(data.encode("ascii"))
+            if blob and blob[0] == _GCM_VERSION:
+                nonce = blob[1 : 1 + NONCE_SIZE]
+                decrypted = self._aead.decrypt(nonce, blob[1 + NONCE_SIZE :], None)
+            elif blob and blob[0] == _FERNET_VERSION:
+                decrypted = self._legacy_fernet().decrypt(data.encode("ascii"))
+            elif blob.startswith(_FERNET_TOKEN_PREFIX):
+                decrypted = self._legacy_fernet().decrypt(blob)
+            else:
+                raise EncryptionError("Decryption failed: unrecognised ciphertext format")
             return decrypted.decode("utf-8")
-        except InvalidToken as e:
+        except EncryptionError:
+            raise
+        except (InvalidTag, InvalidToken) as e:
             raise EncryptionError("Decryption failed: invalid or wrong key") from e
         except Exception as e:
             raise EncryptionError(f"Decryption failed: {e}") from e
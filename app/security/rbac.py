@@ -19,33 +19,37 @@ class Role(Enum):
 # APPROVER  ✗       ✓       ✓     ✗
 # VIEWER    ✗       ✗       ✓     ✗
 
-_ACTION_PERMISSIONS: dict[tuple[Role, str], bool] = {
-    (Role.ADMIN, "create"): True,
-    (Role.ADMIN, "approve"): True,
-    (Role.ADMIN, "view"): True,
-    (Role.ADMIN, "register_model"): True,
-    (Role.ANALYST, "create"): True,
-    (Role.ANALYST, "approve"): False,
-    (Role.ANALYST, "view"): True,
-    (Role.ANALYST, "register_model"): False,
-    (Role.APPROVER, "create"): False,
-    (Role.APPROVER, "approve"): True,
-    (Role.APPROVER, "view"): True,
-    (Role.APPROVER, "register_model"): False,
-    (Role.VIEWER, "create"): False,
-    (Role.VIEWER, "approve"): False,
-    (Role.VIEWER, "view"): True,
-    (Role.VIEWER, "register_model"): False,
+# Each action is one bit; each role holds the OR of its permitted actions.
+_ACTION_BIT: dict[str, int] = {
+    "create": 1,
+    "approve": 2,
+    "view": 4,
+    "register_model": 8,
 }
 
+_ROLE_MASK: dict[Role, int] = {
+    Role.ADMIN: 15,  # create | approve | view | register_model
+    Role.ANALYST: 5,  # create | view
+    Role.APPROVER: 6,  # approve | view
+    Role.VIEWER: 4,  # view
+}
+
+# Flattened "ROLE:action" strings for permitted pairs: one str hash + set
+# membership per check, no Enum hashing.
+_ALLOWED: frozenset[str] = frozenset(
+    f"{role.value}:{action}"
+    for role, mask in _ROLE_MASK.items()
+    for action, bit in _ACTION_BIT.items()
+    if mask & bit
+)
+
 
 class RBACService:
     """Check permission for role and action. Raise AuthorizationError if invalid."""
 
     def check_permission(self, role: Role, action: str) -> None:
         """Raises AuthorizationError if role does not have permission for action."""
-        key = (role, action)
-        if key not in _ACTION_PERMISSIONS or not _ACTION_PERMISSIONS[key]:
+        if f"{role.value}:{action}" not in _ALLOWED:
             raise AuthorizationError(
                 f"Role {role.value} does not have permission for action '{action}'"
             )
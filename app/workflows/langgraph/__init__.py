@@ -1,5 +1,6 @@
 """LangGraph-style AI workflows: risk and compliance pipelines with audit and idempotency."""
 
+from app.workflows.langgraph.node_cache import NodeCache
 from app.workflows.langgraph.state_models import ComplianceState, RiskState
 from app.workflows.langgraph.workflow_state_store import (
     ComplianceStateStore,
@@ -17,4 +18,5 @@ __all__ = [
     "WorkflowStateStore",
     "ComplianceStateStore",
     "RedisWorkflowStateStore",
+    "NodeCache",
 ]
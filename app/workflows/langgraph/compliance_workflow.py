@@ -1,60 +1,66 @@
-"""Compliance workflow: retrieval → policy → scoring → guardrails → compliance decision."""
+"""Compliance workflow: (retrieval ‖ policy ‖ scoring) → guardrails → compliance decision."""
 
+import asyncio
 import logging
 import time
-from typing import TYPE_CHECKING, Optional
-
-from app.governance.audit_logger import AuditLogger
-from app.governance.model_registry import ModelRegistry
-from app.governance.prompt_registry import PromptRegistry
-from app.workflows.langgraph.nodes.compliance_nodes import (
-    apply_guardrails_compliance,
-    make_compliance_decision,
-    retrieve_context_compliance,
-    score_risk_compliance,
-    validate_policy_compliance,
-)
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable, Optional
+
+from app.governance.audit_logger import AuditBatch
+from app.workflows.langgraph.node_cache import NodeCache
+from app.workflows.langgraph.nodes.common import DECISION_APPROVED, DECISION_REQUIRE_APPROVAL
+from app.workflows.langgraph.nodes.compliance_nodes import make_compliance_decision
+from app.workflows.langgraph.nodes.guardrails import apply_guardrails
 from app.workflows.langgraph.state_models import ComplianceState
-from app.workflows.langgraph.workflow_state_store import ComplianceStateStore
+from app.workflows.langgraph.workflow_runner import WorkflowRunnerMixin
 
+# Type-only imports: collaborators are injected, so these modules are never loaded from here.
 if TYPE_CHECKING:
+    from app.governance.audit_logger import AuditLogger
+    from app.governance.model_registry import ModelRegistry
+    from app.governance.prompt_registry import PromptRegistry
     from app.observability.cost_tracker import CostTracker
     from app.observability.evaluation import EvaluationService
     from app.observability.failure_classifier import FailureClassifier
     from app.observability.langfuse_client import LangfuseClient
     from app.observability.metrics import MetricsCollector
     from app.observability.tracing import TracingService
+    from app.workflows.langgraph.workflow_state_store import ComplianceStateStore
 
 logger = logging.getLogger(__name__)
 
-DEFAULT_MODEL_VERSION = "simulated@1"
-DEFAULT_PROMPT_VERSION = 1
-NODE_ORDER = ["retrieval", "policy_validation", "risk_scoring", "guardrails", "decision"]
 
-
-def _node_done_compliance(state: ComplianceState, node: str) -> bool:
-    return any((e.get("node") == node for e in state.audit_trail))
-
-
-class ComplianceWorkflow:
+class ComplianceWorkflow(WorkflowRunnerMixin):
     """
     Compliance workflow with additional compliance gating.
     Automatic approval if low regulatory flags; escalate otherwise.
     Idempotent when state_store is provided. Optional observability hooks.
+    tracing_sample_rate: fraction of requests traced (head-based, keyed by correlation_id).
+    versions_ttl_seconds: how long registry-resolved model/prompt versions are reused.
+    audit_sampler: when set, an APPROVED run for which it returns False keeps only its
+    decision audit record. Escalations and failed runs are always audited in full.
     """
 
+    MODEL_ID = "compliance-model"
+    PROMPT_ID = "compliance-prompt"
+    SEQUENTIAL_NODES = (("guardrails", apply_guardrails), ("decision", make_compliance_decision))
+
     def __init__(
         self,
-        audit_logger: AuditLogger,
-        state_store: Optional[ComplianceStateStore] = None,
-        model_registry: Optional[ModelRegistry] = None,
-        prompt_registry: Optional[PromptRegistry] = None,
+        audit_logger: "AuditLogger",
+        state_store: Optional["ComplianceStateStore"] = None,
+        model_registry: Optional["ModelRegistry"] = None,
+        prompt_registry: Optional["PromptRegistry"] = None,
         metrics_collector: Optional["MetricsCollector"] = None,
         tracing_service: Optional["TracingService"] = None,
         cost_tracker: Optional["CostTracker"] = None,
         failure_classifier: Optional["FailureClassifier"] = None,
         langfuse_client: Optional["LangfuseClient"] = None,
         evaluation_service: Optional["EvaluationService"] = None,
+        node_cache: Optional[NodeCache] = None,
+        tracing_sample_rate: float = 1.0,
+        versions_ttl_seconds: float = 60.0,
+        audit_sampler: Optional[Callable[[ComplianceState], bool]] = None,
     ) -> None:
         self._audit = audit_logger
         self._store = state_store
@@ -66,24 +72,13 @@ class ComplianceWorkflow:
         self._failure_classifier = failure_classifier
         self._langfuse = langfuse_client
         self._evaluation = evaluation_service
-
-    async def _resolve_versions(self, state: ComplianceState) -> ComplianceState:
-        model_version = DEFAULT_MODEL_VERSION
-        prompt_version = DEFAULT_PROMPT_VERSION
-        if self._model_registry:
-            try:
-                record = await self._model_registry.get_model("compliance-model")
-                if record:
-                    model_version = f"{record.model_name}@{record.version}"
-            except Exception:  # noqa: S110
-                pass
-        if self._prompt_registry:
-            prompt_record = await self._prompt_registry.get_prompt("compliance-prompt")
-            if prompt_record:
-                prompt_version = prompt_record.version
-        if state.model_version != model_version or state.prompt_version != prompt_version:
-            return state.transition(model_version=model_version, prompt_version=prompt_version)
-        return state
+        self._node_cache = node_cache
+        self._tracing_sample_rate = tracing_sample_rate
+        self._versions_ttl = versions_ttl_seconds
+        self._versions: Optional[tuple[str, int]] = None
+        self._versions_at = 0.0
+        self._versions_lock = asyncio.Lock()
+        self._audit_sampler = audit_sampler
 
     async def run(self, state: ComplianceState) -> ComplianceState:
         """Run compliance workflow. Return cached state if idempotent hit. Observability when enabled."""
@@ -91,62 +86,14 @@ class ComplianceWorkflow:
             self._metrics.increment("request_count", 1, tenant_id=state.tenant_id)
             self._metrics.increment("workflow_execution_count")
 
-        request_start = time.perf_counter()
-        trace_id: Optional[str] = None
-        parent_span_id: Optional[str] = None
+        request_start = time.perf_counter_ns()
+        # One wall-clock timestamp per request, shared by every trail entry.
+        trail_at = datetime.now(timezone.utc).isoformat()
         current: ComplianceState = state
-
-        async def run_node(name: str, run_fn):
-            nonlocal current
-            node_start = time.perf_counter()
-            if self._tracing and trace_id:
-                async with self._tracing.start_span(
-                    name,
-                    trace_id=trace_id,
-                    parent_span_id=parent_span_id,
-                    tenant_id=current.tenant_id,
-                    correlation_id=current.correlation_id,
-                    model_version=current.model_version,
-                    prompt_version=current.prompt_version,
-                ):
-                    out = await run_fn()
-            else:
-                out = await run_fn()
-            elapsed_ms = (time.perf_counter() - node_start) * 1000
-            if self._metrics:
-                self._metrics.observe_latency("node_execution_latency", elapsed_ms, node=name)
-                self._metrics.increment("model_usage_count")
-                self._metrics.increment("prompt_usage_count")
-            return out
-
-        async def run_all_nodes() -> ComplianceState:
-            nonlocal current
-            if not _node_done_compliance(current, "retrieval"):
-                current = await run_node(
-                    "retrieval",
-                    lambda: retrieve_context_compliance(current, audit_logger=self._audit),
-                )
-            if not _node_done_compliance(current, "policy_validation"):
-                current = await run_node(
-                    "policy_validation",
-                    lambda: validate_policy_compliance(current, audit_logger=self._audit),
-                )
-            if not _node_done_compliance(current, "risk_scoring"):
-                current = await run_node(
-                    "risk_scoring",
-                    lambda: score_risk_compliance(current, audit_logger=self._audit),
-                )
-            if not _node_done_compliance(current, "guardrails"):
-                current = await run_node(
-                    "guardrails",
-                    lambda: apply_guardrails_compliance(current, audit_logger=self._audit),
-                )
-            if not _node_done_compliance(current, "decision"):
-                current = await run_node(
-                    "decision",
-                    lambda: make_compliance_decision(current, audit_logger=self._audit),
-                )
-            return current
+        # Nodes log into a per-request batch; it is written in one bulk call after the nodes run.
+        batch = AuditBatch(enabled=self._audit.enabled)
+        # Node cache entries from this request; cached only after the batch is persisted.
+        staged: list = []
 
         try:
             if self._store:
@@ -160,22 +107,34 @@ class ComplianceWorkflow:
 
             current = await self._resolve_versions(state)
 
-            if self._tracing:
+            # Unsampled requests never enter a span: traced=False, so their node spans are skipped too.
+            if self._tracing and self._tracing.should_sample(state.correlation_id, self._tracing_sample_rate):
                 async with self._tracing.start_span(
                     "compliance_workflow",
                     tenant_id=state.tenant_id,
                     correlation_id=state.correlation_id,
-                ) as root_span:
-                    trace_id = root_span.trace_id
-                    parent_span_id = root_span.span_id
-                    current = await run_all_nodes()
+                ):
+                    current = await self._run_all_nodes(
+                        current, batch=batch, trail_at=trail_at, staged=staged, traced=True
+                    )
             else:
-                current = await run_all_nodes()
-
-            if self._metrics and (current.approval_required or current.final_decision == "REQUIRE_APPROVAL"):
+                current = await self._run_all_nodes(
+                    current, batch=batch, trail_at=trail_at, staged=staged, traced=False
+                )
+            if (
+                self._audit_sampler is not None
+                and current.final_decision == DECISION_APPROVED
+                and not self._audit_sampler(current)
+            ):
+                batch.retain(lambda e: e["action"] == "decision_made")
+            await batch.flush(self._audit)
+            if self._node_cache is not None:
+                self._node_cache.commit(staged)
+
+            if self._metrics and (current.approval_required or current.final_decision == DECISION_REQUIRE_APPROVAL):
                 self._metrics.increment("approval_required_count")
 
-            request_latency_ms = (time.perf_counter() - request_start) * 1000
+            request_latency_ms = (time.perf_counter_ns() - request_start) / 1_000_000
             if self._metrics:
                 self._metrics.observe_latency("request_latency", request_latency_ms)
 
@@ -187,28 +146,37 @@ class ComplianceWorkflow:
                     request_id=current.event_id,
                 )
 
+            # Langfuse logging and evaluation are independent: run them concurrently.
+            # The state-store write waits for both, since it persists evaluation_result.
+            tail = []
             if self._langfuse:
-                await self._langfuse.log_generation(
-                    event_id=current.event_id,
-                    tenant_id=current.tenant_id,
-                    prompt_version=current.prompt_version,
-                    model_version=current.model_version,
-                    input_tokens=100,
-                    output_tokens=50,
-                    latency_ms=request_latency_ms,
+                tail.append(
+                    self._langfuse.log_generation(
+                        event_id=current.event_id,
+                        tenant_id=current.tenant_id,
+                        prompt_version=current.prompt_version,
+                        model_version=current.model_version,
+                        input_tokens=100,
+                        output_tokens=50,
+                        latency_ms=request_latency_ms,
+                    )
                 )
-
             if self._evaluation:
-                eval_result = await self._evaluation.evaluate_decision(
-                    tenant_id=current.tenant_id,
-                    event_id=current.event_id,
-                    correlation_id=current.correlation_id,
-                    final_decision=current.final_decision or "",
-                    policy_result=current.policy_result or "",
-                    guardrail_result=current.guardrail_result or "",
-                    risk_score=current.risk_score,
+                tail.append(
+                    self._evaluation.evaluate_decision(
+                        tenant_id=current.tenant_id,
+                        event_id=current.event_id,
+                        correlation_id=current.correlation_id,
+                        final_decision=current.final_decision or "",
+                        policy_result=current.policy_result or "",
+                        guardrail_result=current.guardrail_result or "",
+                        risk_score=current.risk_score,
+                    )
                 )
-                current = current.transition(evaluation_result=eval_result.to_dict())
+            if tail:
+                results = await asyncio.gather(*tail)
+                if self._evaluation:
+                    current = current.transition(evaluation_result=results[-1].to_dict())
 
             if self._store:
                 await self._store.set_compliance_state(current.event_id, current)
@@ -219,4 +187,13 @@ class ComplianceWorkflow:
             if self._failure_classifier and self._metrics:
                 cat = self._failure_classifier.classify(e)
                 self._metrics.increment("failure_count", 1, category=cat.value)
+            if len(batch):
+                # Keep the audit trail of nodes that did run; do not mask the original error.
+                try:
+                    await batch.flush(self._audit)
+                except Exception:
+                    logger.exception(
+                        "compliance_audit_flush_failed",
+                        extra={"event_id": state.event_id, "correlation_id": state.correlation_id},
+                    )
             raise
@@ -0,0 +1,101 @@
+"""Node-level memoization for workflow nodes. Keyed by (event_id, node, versions, input hash). Process-local LRU."""
+
+import hashlib
+import json
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, TypeVar
+
+from app.governance.audit_logger import AuditLogger
+
+S = TypeVar("S")
+
+# State fields each node reads (besides event_id / model_version / prompt_version, always keyed).
+NODE_INPUTS: dict[str, tuple[str, ...]] = {
+    "retrieval": ("tenant_id", "raw_event"),
+    "policy_validation": ("raw_event",),
+    "risk_scoring": ("raw_event",),
+    "guardrails": ("raw_event", "risk_score"),
+    "decision": ("policy_result", "risk_score", "guardrail_result", "regulatory_flags"),
+}
+
+
+class NodeCache:
+    """
+    Memoizes deterministic node outputs. On a hit the node body and its audit write are
+    skipped (the audit record already exists from the run that populated the entry); the
+    cached trail entry is re-stamped with the request time and marked "cached".
+    Model/prompt version are part of the key, so a version change invalidates naturally.
+    When nodes log into a per-request AuditBatch, pass staged= to run() and commit() the
+    staged entries only after the batch is flushed, so a failed flush is not cached.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[dict[str, Any], dict[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(node: str, state: Any) -> str:
+        """Stable key: sha1 of node name, identity/version fields and the node's inputs."""
+        inputs = {f: getattr(state, f, None) for f in NODE_INPUTS.get(node, ())}
+        payload = json.dumps(
+            [node, state.event_id, state.model_version, state.prompt_version, inputs],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def run(
+        self,
+        node: str,
+        node_fn: Callable[..., Awaitable[S]],
+        state: S,
+        *,
+        audit_logger: AuditLogger,
+        trail_at: str | None = None,
+        staged: list[tuple[str, Any]] | None = None,
+    ) -> S:
+        """
+        Return the cached transition for (node, state) or run node_fn and remember its output.
+        With staged, a miss's entry is appended there instead of stored; see commit().
+        """
+        key = self.key(node, state)
+        hit = self._entries.get(key)
+        if hit is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            updates, entry = hit
+            replayed = {**entry, "at": trail_at or datetime.now(timezone.utc).isoformat(), "cached": True}
+            return state.append_audit(replayed, **updates)  # type: ignore[attr-defined]
+        self.misses += 1
+        out = await node_fn(state, audit_logger=audit_logger, trail_at=trail_at)
+        updates = {
+            f: getattr(out, f)
+            for f in type(out).model_fields  # type: ignore[attr-defined]
+            if f not in ("audit_trail", "completed_nodes") and getattr(out, f) != getattr(state, f)
+        }
+        entry = (updates, dict(out.audit_trail[-1]))  # type: ignore[attr-defined]
+        if staged is None:
+            self._put(key, entry)
+        else:
+            staged.append((key, entry))
+        return out
+
+    def commit(self, staged: list[tuple[str, Any]]) -> None:
+        """Store entries staged by run() once their audit records are persisted, then clear."""
+        for key, entry in staged:
+            self._put(key, entry)
+        staged.clear()
+
+    def _put(self, key: str, entry: tuple[dict[str, Any], dict[str, Any]]) -> None:
+        self._entries[key] = entry
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
@@ -0,0 +1,111 @@
+"""Shared node scaffolding: timing, audit trail entry, audit emission, state transition."""
+
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, TypeVar
+
+from app.governance.audit_logger import AuditLogger
+
+logger = logging.getLogger(__name__)
+
+S = TypeVar("S")
+
+WORKFLOW_ACTOR = "workflow"
+HIGH_RISK_THRESHOLD = 75.0
+
+# Result values. Literals are interned by the compiler; states loaded from the store
+# intern theirs on validation, so == on these hits the identity fast path.
+POLICY_PASS = "PASS"
+POLICY_FAIL = "FAIL"
+GUARDRAIL_OK = "OK"
+GUARDRAIL_VIOLATION = "VIOLATION"
+DECISION_APPROVED = "APPROVED"
+DECISION_REQUIRE_APPROVAL = "REQUIRE_APPROVAL"
+
+# Decision rule as data. Index bits: 0 policy FAIL, 1 high risk, 2 guardrail violation,
+# 3 regulatory flags present. Value: (final_decision, approval_required).
+DECISION_TABLE: tuple[tuple[str, bool], ...] = ((DECISION_APPROVED, False),) + (
+    (DECISION_REQUIRE_APPROVAL, True),
+) * 15
+
+
+def decision_key(state: Any, has_regulatory_flags: bool = False) -> int:
+    """Pack the decision inputs into a DECISION_TABLE index."""
+    return (
+        (state.policy_result == POLICY_FAIL)
+        | (((state.risk_score or 0.0) >= HIGH_RISK_THRESHOLD) << 1)
+        | ((state.guardrail_result == GUARDRAIL_VIOLATION) << 2)
+        | (has_regulatory_flags << 3)
+    )
+
+
+# Module-level aliases: resolved once at import instead of per node call.
+_perf_counter_ns = time.perf_counter_ns
+_utcnow = datetime.now
+_UTC = timezone.utc
+
+# compute(state) -> (state updates, node-specific fields for trail entry and audit metadata).
+# The two dicts may be the same object; neither is mutated after compute returns.
+NodeCompute = Callable[[Any], tuple[dict[str, Any], dict[str, Any]]]
+
+
+async def execute_node(
+    state: S,
+    *,
+    node: str,
+    action: str,
+    reason: str,
+    compute: NodeCompute,
+    audit_logger: AuditLogger,
+    log_event: str | None = None,
+    trail_at: str | None = None,
+) -> S:
+    """
+    Run one node: time compute(state), emit one audit record and return the state with
+    updates applied and one audit_trail entry appended. Metadata is built once and reused for both.
+    trail_at: ISO timestamp for the trail entry, computed once per request by the workflow;
+    falls back to the current time when a node is called directly.
+    """
+    # Bind state fields once; pydantic attribute access goes through descriptors.
+    event_id = state.event_id  # type: ignore[attr-defined]
+    tenant_id = state.tenant_id  # type: ignore[attr-defined]
+    correlation_id = state.correlation_id  # type: ignore[attr-defined]
+    model_version = state.model_version  # type: ignore[attr-defined]
+    prompt_version = state.prompt_version  # type: ignore[attr-defined]
+
+    start_ns = _perf_counter_ns()
+    updates, fields = compute(state)
+    # Integer ns -> hundredths of a ms, then one float divide (truncates to 2 dp).
+    elapsed_ms = ((_perf_counter_ns() - start_ns) // 10_000) / 100
+
+    # metadata goes to the audit logger by reference: AuditRecord is frozen and never mutates it.
+    metadata = {
+        "model_version": model_version,
+        "prompt_version": prompt_version,
+        "execution_ms": elapsed_ms,
+        **fields,
+    }
+    trail_entry = {
+        "node": node,
+        "action": action,
+        "at": trail_at or _utcnow(_UTC).isoformat(),
+        **metadata,
+    }
+    # The trail entry is part of the state (resume, completed_nodes) and is always built;
+    # only the audit write is skipped when the logger is disabled.
+    if audit_logger.enabled:
+        await audit_logger.log_action(
+            actor=WORKFLOW_ACTOR,
+            tenant_id=tenant_id,
+            action=action,
+            resource_type="workflow",
+            resource_id=event_id,
+            reason=reason,
+            correlation_id=correlation_id,
+            metadata=metadata,
+        )
+    # isEnabledFor is cached by logging; skips building extra when INFO is filtered out.
+    if log_event and logger.isEnabledFor(logging.INFO):
+        logger.info(log_event, extra={"event_id": event_id, **metadata})
+    return state.append_audit(trail_entry, **updates)  # type: ignore[attr-defined]
@@ -1,76 +1,51 @@
 """Risk scoring node: deterministic score from event type and metadata."""
 
-import logging
-import time
-from datetime import datetime, timezone
+from typing import Any
 
 from app.governance.audit_logger import AuditLogger
-from app.workflows.langgraph.state_models import RiskState
+from app.workflows.langgraph.nodes.common import execute_node
+from app.workflows.langgraph.state_models import WorkflowState
 
-logger = logging.getLogger(__name__)
 
-WORKFLOW_ACTOR = "workflow"
+# Deterministic mapping, precedence high_risk -> 85, sensitive category -> 70,
+# low_risk -> 15, else 30. Keyed by (event_type, category is sensitive); pairs not
+# listed fall back on the sensitive flag alone.
+SCORE_TABLE: dict[tuple[str, bool], float] = {
+    ("high_risk", False): 85.0,
+    ("high_risk", True): 85.0,
+    ("low_risk", False): 15.0,
+}
+DEFAULT_SCORES: dict[bool, float] = {False: 30.0, True: 70.0}
+
+
+def _score(state: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+    raw = state.raw_event or {}
+    event_type = raw.get("event_type", "standard")
+    sensitive = (raw.get("metadata") or {}).get("category") == "sensitive"
+    risk_score = SCORE_TABLE.get((event_type, sensitive))
+    if risk_score is None:
+        risk_score = DEFAULT_SCORES[sensitive]
+    fields = {"risk_score": risk_score}
+    return fields, fields
 
 
 async def score_risk(
-    state: RiskState,
+    state: WorkflowState,
     *,
     audit_logger: AuditLogger,
-) -> RiskState:
+    trail_at: str | None = None,
+) -> WorkflowState:
     """
     Deterministic risk scoring based on event type and metadata.
     Score in [0.0, 100.0]. No randomness.
     """
-    start = time.perf_counter()
-    raw = state.raw_event or {}
-    event_type = raw.get("event_type", "standard")
-    metadata = raw.get("metadata") or {}
-    # Deterministic mapping: high_risk -> 85, sensitive -> 70, standard -> 30
-    if event_type == "high_risk":
-        risk_score = 85.0
-    elif metadata.get("category") == "sensitive":
-        risk_score = 70.0
-    elif event_type == "low_risk":
-        risk_score = 15.0
-    else:
-        risk_score = 30.0
-    elapsed_ms = (time.perf_counter() - start) * 1000
-
-    trail_entry = {
-        "node": "risk_scoring",
-        "action": "risk_scored",
-        "at": datetime.now(timezone.utc).isoformat(),
-        "model_version": state.model_version,
-        "prompt_version": state.prompt_version,
-        "execution_ms": round(elapsed_ms, 2),
-        "risk_score": risk_score,
-    }
-    new_trail = list(state.audit_trail) + [trail_entry]
-
-    await audit_logger.log_action(
-        actor=WORKFLOW_ACTOR,
-        tenant_id=state.tenant_id,
+    return await execute_node(
+        state,
+        node="risk_scoring",
         action="risk_scored",
-        resource_type="workflow",
-        resource_id=state.event_id,
         reason="deterministic_scoring",
-        correlation_id=state.correlation_id,
-        metadata={
-            "model_version": state.model_version,
-            "prompt_version": state.prompt_version,
-            "execution_ms": round(elapsed_ms, 2),
-            "risk_score": risk_score,
-        },
-    )
-    logger.info(
-        "risk_scoring_node_completed",
-        extra={
-            "event_id": state.event_id,
-            "risk_score": risk_score,
-            "model_version": state.model_version,
-        },
-    )
-    return state.transition(
-        risk_score=risk_score,
-        audit_trail=new_trail,
+        compute=_score,
+        audit_logger=audit_logger,
+        trail_at=trail_at,
+        log_event="risk_scoring_node_completed",
     )
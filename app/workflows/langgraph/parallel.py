@@ -0,0 +1,29 @@
+"""Fan-out/fan-in for workflow nodes that only read the incoming event and can run concurrently."""
+
+from app.workflows.langgraph.nodes.policy_validation import validate_policy
+from app.workflows.langgraph.nodes.retrieval import retrieve_context
+from app.workflows.langgraph.nodes.risk_scoring import score_risk
+from app.workflows.langgraph.state_models import WorkflowState
+
+# Nodes that read only raw_event/tenant, with the field each one sets. Shared by both workflows.
+PARALLEL_NODES = (
+    ("retrieval", retrieve_context, "retrieved_context"),
+    ("policy_validation", validate_policy, "policy_result"),
+    ("risk_scoring", score_risk, "risk_score"),
+)
+
+
+def merge_parallel(
+    base: WorkflowState, results: list[tuple[str, WorkflowState]]
+) -> WorkflowState:
+    """
+    Fan-in for concurrently run nodes: each result is base plus one trail entry and one
+    output field. Take that field from each and append their trail entries in node order.
+    """
+    updates: dict = {}
+    trail = list(base.audit_trail)
+    for field, out in results:
+        updates[field] = getattr(out, field)
+        trail.append(out.audit_trail[-1])
+    updates["audit_trail"] = trail
+    return base.transition(**updates)
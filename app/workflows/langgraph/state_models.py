@@ -1,8 +1,18 @@
 """Deterministic state containers for AI workflows. Immutable transitions, fully serializable."""
 
-from typing import Any
+import sys
+from typing import Any, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer, field_validator, model_validator
+
+
+def _intern_result(value: str | None) -> str | None:
+    """Intern result strings (e.g. from JSON) so comparisons against constants short-circuit."""
+    return sys.intern(value) if value is not None else None
+
+
+def _trail_nodes(audit_trail: list[dict[str, Any]]) -> frozenset[str]:
+    return frozenset(e["node"] for e in audit_trail if e.get("node"))
 
 
 class RiskState(BaseModel):
@@ -23,14 +33,50 @@ class RiskState(BaseModel):
     model_version: str = "simulated@1"
     prompt_version: int = 1
     audit_trail: list[dict[str, Any]] = Field(default_factory=list)
+    # Nodes recorded in audit_trail, kept alongside it for O(1) "already ran?" checks on resume.
+    completed_nodes: frozenset[str] = frozenset()
     idempotency_key: str | None = None
     evaluation_result: dict[str, Any] | None = None
 
     model_config = {"frozen": False}  # Pydantic allows copy; we never mutate in place in nodes
 
+    _intern_results = field_validator(
+        "policy_result", "guardrail_result", "final_decision"
+    )(_intern_result)
+
+    @model_validator(mode="after")
+    def _derive_completed_nodes(self) -> "RiskState":
+        # States built from a trail (resume, or stored before completed_nodes existed).
+        if not self.completed_nodes and self.audit_trail:
+            self.completed_nodes = _trail_nodes(self.audit_trail)
+        return self
+
+    @field_serializer("completed_nodes", when_used="json")
+    def _serialize_completed_nodes(self, nodes: frozenset[str]) -> list[str]:
+        return sorted(nodes)
+
     def transition(self, **updates: Any) -> "RiskState":
-        """Return a new state with the given updates. Original unchanged."""
-        return self.model_copy(update=updates, deep=True)
+        """
+        Return a new state with the given updates. Original unchanged.
+        Shallow: unchanged nested values (raw_event, audit_trail entries) are shared,
+        which is safe because nodes only ever replace fields, never mutate them in place.
+        """
+        if "audit_trail" in updates and "completed_nodes" not in updates:
+            updates["completed_nodes"] = _trail_nodes(updates["audit_trail"])
+        return self.model_copy(update=updates)
+
+    def append_audit(self, entry: dict[str, Any], **updates: Any) -> "RiskState":
+        """
+        Return a new state with entry appended to audit_trail (plus any updates).
+        Append-only: builds one new list and shares the existing entries. Original unchanged.
+        """
+        return self.model_copy(
+            update={
+                **updates,
+                "audit_trail": [*self.audit_trail, entry],
+                "completed_nodes": self.completed_nodes | {entry["node"]},
+            }
+        )
 
 
 class ComplianceState(BaseModel):
@@ -53,11 +99,51 @@ class ComplianceState(BaseModel):
     model_version: str = "simulated@1"
     prompt_version: int = 1
     audit_trail: list[dict[str, Any]] = Field(default_factory=list)
+    # Nodes recorded in audit_trail, kept alongside it for O(1) "already ran?" checks on resume.
+    completed_nodes: frozenset[str] = frozenset()
     idempotency_key: str | None = None
     evaluation_result: dict[str, Any] | None = None
 
     model_config = {"frozen": False}
 
+    _intern_results = field_validator(
+        "policy_result", "guardrail_result", "final_decision"
+    )(_intern_result)
+
+    @model_validator(mode="after")
+    def _derive_completed_nodes(self) -> "ComplianceState":
+        # States built from a trail (resume, or stored before completed_nodes existed).
+        if not self.completed_nodes and self.audit_trail:
+            self.completed_nodes = _trail_nodes(self.audit_trail)
+        return self
+
+    @field_serializer("completed_nodes", when_used="json")
+    def _serialize_completed_nodes(self, nodes: frozenset[str]) -> list[str]:
+        return sorted(nodes)
+
     def transition(self, **updates: Any) -> "ComplianceState":
-        """Return a new state with the given updates. Original unchanged."""
-        return self.model_copy(update=updates, deep=True)
+        """
+        Return a new state with the given updates. Original unchanged.
+        Shallow: unchanged nested values (raw_event, audit_trail entries) are shared,
+        which is safe because nodes only ever replace fields, never mutate them in place.
+        """
+        if "audit_trail" in updates and "completed_nodes" not in updates:
+            updates["completed_nodes"] = _trail_nodes(updates["audit_trail"])
+        return self.model_copy(update=updates)
+
+    def append_audit(self, entry: dict[str, Any], **updates: Any) -> "ComplianceState":
+        """
+        Return a new state with entry appended to audit_trail (plus any updates).
+        Append-only: builds one new list and shares the existing entries. Original unchanged.
+        """
+        return self.model_copy(
+            update={
+                **updates,
+                "audit_trail": [*self.audit_trail, entry],
+                "completed_nodes": self.completed_nodes | {entry["node"]},
+            }
+        )
+
+
+# Nodes shared by both workflows are generic over the state type they receive and return.
+WorkflowState = TypeVar("WorkflowState", RiskState, ComplianceState)
@@ -0,0 +1,169 @@
+"""Shared workflow plumbing: registry version resolution and node execution (cache, spans, metrics)."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Optional
+
+from app.governance.audit_logger import AuditBatch
+from app.workflows.langgraph.node_cache import NodeCache
+from app.workflows.langgraph.parallel import PARALLEL_NODES, merge_parallel
+from app.workflows.langgraph.state_models import WorkflowState
+
+if TYPE_CHECKING:
+    from app.governance.model_registry import ModelRegistry
+    from app.governance.prompt_registry import PromptRegistry
+    from app.observability.metrics import MetricsCollector
+    from app.observability.tracing import TracingService
+
+DEFAULT_MODEL_VERSION = "simulated@1"
+DEFAULT_PROMPT_VERSION = 1
+NODE_ORDER = ["retrieval", "policy_validation", "risk_scoring", "guardrails", "decision"]
+
+
+def _node_done(state: WorkflowState, node: str) -> bool:
+    """True if the node is in state.completed_nodes (kept in step with audit_trail)."""
+    return node in state.completed_nodes
+
+
+class WorkflowRunnerMixin:
+    """
+    Shared by RiskWorkflow and ComplianceWorkflow. Subclasses set MODEL_ID / PROMPT_ID
+    (registry names), SEQUENTIAL_NODES (nodes after the concurrent prefix, in order) and
+    assign the collaborator and version-cache attributes below in __init__.
+    """
+
+    MODEL_ID: str
+    PROMPT_ID: str
+    SEQUENTIAL_NODES: tuple[tuple[str, Any], ...]
+
+    _model_registry: Optional["ModelRegistry"]
+    _prompt_registry: Optional["PromptRegistry"]
+    _metrics: Optional["MetricsCollector"]
+    _tracing: Optional["TracingService"]
+    _node_cache: Optional[NodeCache]
+    _versions_ttl: float
+    _versions: Optional[tuple[str, int]]
+    _versions_at: float
+    _versions_lock: asyncio.Lock
+
+    def _call_node(
+        self, name: str, node_fn, state, audit, trail_at: Optional[str] = None, staged=None
+    ):
+        """
+        Invoke a node, through the node cache when one is configured. Cache entries go to
+        staged and are committed by run() only once the audit batch has been flushed.
+        """
+        if self._node_cache is not None:
+            return self._node_cache.run(
+                name, node_fn, state, audit_logger=audit, trail_at=trail_at, staged=staged
+            )
+        return node_fn(state, audit_logger=audit, trail_at=trail_at)
+
+    def _versions_stale(self) -> bool:
+        return self._versions is None or time.monotonic() - self._versions_at >= self._versions_ttl
+
+    async def _fetch_versions(self) -> tuple[str, int]:
+        model_version = DEFAULT_MODEL_VERSION
+        prompt_version = DEFAULT_PROMPT_VERSION
+        if self._model_registry:
+            try:
+                record = await self._model_registry.get_model(self.MODEL_ID)
+                if record:
+                    model_version = f"{record.model_name}@{record.version}"
+            except Exception:  # noqa: S110
+                pass
+        if self._prompt_registry:
+            prompt_record = await self._prompt_registry.get_prompt(self.PROMPT_ID)
+            if prompt_record:
+                prompt_version = prompt_record.version
+        return model_version, prompt_version
+
+    async def _resolve_versions(self, state: WorkflowState) -> WorkflowState:
+        """
+        Set model_version and prompt_version from registries if available.
+        A state that already carries non-default versions is returned unchanged.
+        No registries: defaults, no await. Otherwise lookups are cached for
+        versions_ttl_seconds; one caller refills while concurrent callers wait.
+        """
+        if (
+            state.model_version != DEFAULT_MODEL_VERSION
+            and state.prompt_version != DEFAULT_PROMPT_VERSION
+        ):
+            # Versions already pinned (resume / cached state): keep them, skip the registries.
+            return state
+        if self._model_registry is None and self._prompt_registry is None:
+            model_version, prompt_version = DEFAULT_MODEL_VERSION, DEFAULT_PROMPT_VERSION
+        else:
+            if self._versions_stale():
+                async with self._versions_lock:
+                    if self._versions_stale():
+                        self._versions = await self._fetch_versions()
+                        self._versions_at = time.monotonic()
+            model_version, prompt_version = self._versions
+        if state.model_version != model_version or state.prompt_version != prompt_version:
+            return state.transition(model_version=model_version, prompt_version=prompt_version)
+        return state
+
+    async def _run_node(
+        self,
+        name: str,
+        node_fn,
+        node_state: WorkflowState,
+        *,
+        batch: AuditBatch,
+        trail_at: str,
+        staged: list,
+        traced: bool,
+    ) -> WorkflowState:
+        """
+        Run one node and record its latency and usage metrics. traced: the caller is inside
+        the root span; the node span picks up trace and parent from the span context.
+        """
+        node_start = time.perf_counter_ns()
+        if traced:
+            async with self._tracing.start_span(
+                name,
+                tenant_id=node_state.tenant_id,
+                correlation_id=node_state.correlation_id,
+                model_version=node_state.model_version,
+                prompt_version=node_state.prompt_version,
+            ):
+                out = await self._call_node(name, node_fn, node_state, batch, trail_at, staged)
+        else:
+            out = await self._call_node(name, node_fn, node_state, batch, trail_at, staged)
+        elapsed_ms = (time.perf_counter_ns() - node_start) / 1_000_000
+        if self._metrics:
+            self._metrics.observe_latency("node_execution_latency", elapsed_ms, node=name)
+            self._metrics.increment("model_usage_count")
+            self._metrics.increment("prompt_usage_count")
+        return out
+
+    async def _run_all_nodes(
+        self,
+        state: WorkflowState,
+        *,
+        batch: AuditBatch,
+        trail_at: str,
+        staged: list,
+        traced: bool,
+    ) -> WorkflowState:
+        """Run every node not yet in the trail: the independent prefix concurrently, then the rest in order."""
+        ctx = {"batch": batch, "trail_at": trail_at, "staged": staged, "traced": traced}
+        # retrieval, policy_validation and risk_scoring are independent: fan out, then merge.
+        current = state
+        pending = [
+            (name, node_fn, field)
+            for name, node_fn, field in PARALLEL_NODES
+            if not _node_done(state, name)
+        ]
+        if pending:
+            outs = await asyncio.gather(
+                *(self._run_node(name, node_fn, state, **ctx) for name, node_fn, _ in pending)
+            )
+            current = merge_parallel(
+                state, [(field, out) for (_, _, field), out in zip(pending, outs)]
+            )
+        for name, node_fn in self.SEQUENTIAL_NODES:
+            if not _node_done(current, name):
+                current = await self._run_node(name, node_fn, current, **ctx)
+        return current
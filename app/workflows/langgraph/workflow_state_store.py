@@ -1,6 +1,10 @@
 """Workflow state store for idempotency: cache state by event_id. Protocol + Redis implementation."""
 
-from typing import Protocol
+import base64
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Protocol
 
 from app.workflows.langgraph.state_models import ComplianceState, RiskState
 
@@ -29,22 +33,43 @@ class ComplianceStateStore(Protocol):
         ...
 
 
+# Payloads at or above this size are stored zlib-compressed behind a version prefix.
+# Plain JSON (always starts with "{") is still read, so older entries stay valid.
+COMPRESS_MIN_CHARS = 1024
+_ZLIB_PREFIX = "z1:"
+_ZLIB_LEVEL = 6
+
+
+def _encode_payload(payload: str) -> str:
+    if len(payload) < COMPRESS_MIN_CHARS:
+        return payload
+    packed = zlib.compress(payload.encode("utf-8"), _ZLIB_LEVEL)
+    # The Redis client runs with decode_responses=True, so compressed bytes travel as base64.
+    return _ZLIB_PREFIX + base64.b64encode(packed).decode("ascii")
+
+
+def _decode_payload(data: str) -> str:
+    if data.startswith(_ZLIB_PREFIX):
+        return zlib.decompress(base64.b64decode(data[len(_ZLIB_PREFIX) :])).decode("utf-8")
+    return data
+
+
 def _risk_state_to_json(state: RiskState) -> str:
-    """Serialize RiskState to JSON string."""
-    return state.model_dump_json()
+    """Serialize RiskState to JSON string (compressed when large)."""
+    return _encode_payload(state.model_dump_json())
 
 
 def _risk_state_from_json(data: str) -> RiskState:
-    """Deserialize JSON string to RiskState."""
-    return RiskState.model_validate_json(data)
+    """Deserialize stored payload (plain or compressed JSON) to RiskState."""
+    return RiskState.model_validate_json(_decode_payload(data))
 
 
 def _compliance_state_to_json(state: ComplianceState) -> str:
-    return state.model_dump_json()
+    return _encode_payload(state.model_dump_json())
 
 
 def _compliance_state_from_json(data: str) -> ComplianceState:
-    return ComplianceState.model_validate_json(data)
+    return ComplianceState.model_validate_json(_decode_payload(data))
 
 
 class RedisWorkflowStateStore:
@@ -66,11 +91,32 @@ class RedisWorkflowStateStore:
             return None
         return _risk_state_from_json(raw)
 
+    async def get_risk_state_raw(self, event_id: str) -> str | None:
+        """
+        Cached risk state as a JSON string, without building a RiskState. For callers on the
+        idempotent-hit path that only forward or peek at the stored result.
+        """
+        raw = await self._redis.get_cache(self._key(event_id))  # type: ignore[union-attr]
+        if raw is None:
+            return None
+        return _decode_payload(raw)
+
     async def set_risk_state(self, event_id: str, state: RiskState, ttl_seconds: int = 3600) -> None:
         await self._redis.set_cache(  # type: ignore[union-attr]
             self._key(event_id), _risk_state_to_json(state), ttl=ttl_seconds
         )
 
+    async def get_risk_states(self, event_ids: list[str]) -> list[RiskState | None]:
+        """Cached risk states for several event_ids in one MGET round trip; None where missing."""
+        raws = await self._redis.mget_cache([self._key(e) for e in event_ids])  # type: ignore[union-attr]
+        return [None if raw is None else _risk_state_from_json(raw) for raw in raws]
+
+    async def set_risk_states(self, states: list[RiskState], ttl_seconds: int = 3600) -> None:
+        """Store several risk states in one pipelined Redis round trip."""
+        await self._redis.set_cache_many(  # type: ignore[union-attr]
+            {self._key(s.event_id): _risk_state_to_json(s) for s in states}, ttl=ttl_seconds
+        )
+
     async def get_compliance_state(self, event_id: str) -> ComplianceState | None:
         raw = await self._redis.get_cache(self._compliance_key(event_id))  # type: ignore[union-attr]
         if raw is None:
@@ -85,3 +131,90 @@ class RedisWorkflowStateStore:
             _compliance_state_to_json(state),
             ttl=ttl_seconds,
         )
+
+    async def get_compliance_states(self, event_ids: list[str]) -> list[ComplianceState | None]:
+        """Cached compliance states for several event_ids in one MGET round trip; None where missing."""
+        raws = await self._redis.mget_cache(  # type: ignore[union-attr]
+            [self._compliance_key(e) for e in event_ids]
+        )
+        return [None if raw is None else _compliance_state_from_json(raw) for raw in raws]
+
+    async def set_compliance_states(
+        self, states: list[ComplianceState], ttl_seconds: int = 3600
+    ) -> None:
+        """Store several compliance states in one pipelined Redis round trip."""
+        await self._redis.set_cache_many(  # type: ignore[union-attr]
+            {self._compliance_key(s.event_id): _compliance_state_to_json(s) for s in states},
+            ttl=ttl_seconds,
+        )
+
+
+class LocalCachedStateStore:
+    """
+    Process-local LRU + TTL cache in front of a risk/compliance state store. Repeat lookups
+    for the same event_id (retries, duplicate deliveries) skip the backend round trip.
+    Entries are kept as JSON and decoded on every hit, so each caller gets its own state:
+    states share nested audit_trail/raw_event values across transitions, and a caller
+    mutating one must not change what later hits see. Stored states are final results and
+    never change for an event_id, so a hit can only be stale by being kept up to ttl_seconds
+    after the backend expired it.
+    """
+
+    def __init__(self, inner: Any, maxsize: int = 10_000, ttl_seconds: float = 300.0) -> None:
+        self._inner = inner
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: str) -> str | None:
+        hit = self._entries.get(key)
+        if hit is None:
+            return None
+        expires_at, payload = hit
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def _put(self, key: str, state: Any) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, state.model_dump_json())
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_risk_state(self, event_id: str) -> RiskState | None:
+        key = f"risk:{event_id}"
+        payload = self._get(key)
+        if payload is not None:
+            return RiskState.model_validate_json(payload)
+        state = await self._inner.get_risk_state(event_id)
+        if state is not None:
+            self._put(key, state)
+        return state
+
+    async def set_risk_state(self, event_id: str, state: RiskState, ttl_seconds: int = 3600) -> None:
+        await self._inner.set_risk_state(event_id, state, ttl_seconds=ttl_seconds)
+        self._put(f"risk:{event_id}", state)
+
+    async def get_compliance_state(self, event_id: str) -> ComplianceState | None:
+        key = f"compliance:{event_id}"
+        payload = self._get(key)
+        if payload is not None:
+            return ComplianceState.model_validate_json(payload)
+        state = await self._inner.get_compliance_state(event_id)
+        if state is not None:
+            self._put(key, state)
+        return state
+
+    async def set_compliance_state(
+        self, event_id: str, state: ComplianceState, ttl_seconds: int = 3600
+    ) -> None:
+        await self._inner.set_compliance_state(event_id, state, ttl_seconds=ttl_seconds)
+        self._put(f"compliance:{event_id}", state)
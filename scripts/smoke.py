@@ -0,0 +1,23 @@
+# scripts/smoke.py
+# Runs the Postgres, RabbitMQ and Redis connectivity checks on one event loop,
+# concurrently, reusing each client's connection pool.
+import sys
+from pathlib import Path
+
+# Ensure project root is on the path when running this script directly
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import asyncio
+
+from scripts.test_db import test_connection as test_db
+from scripts.test_rabbit import test as test_rabbit
+from scripts.test_redis import test as test_redis
+
+
+async def main():
+    await asyncio.gather(test_db(), test_rabbit(), test_redis())
+
+
+if __name__ == "__main__":
+    with asyncio.Runner() as runner:
+        runner.run(main())
@@ -18,4 +18,6 @@ async def test_connection():
         result = await conn.execute(text("SELECT 1"))
         print("DB Connected:", result.scalar())
 
-asyncio.run(test_connection())
+
+if __name__ == "__main__":
+    asyncio.run(test_connection())
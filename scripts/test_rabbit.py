@@ -22,4 +22,6 @@ async def test():
 
     print("Published")
 
-asyncio.run(test())
+
+if __name__ == "__main__":
+    asyncio.run(test())
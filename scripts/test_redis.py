@@ -20,4 +20,6 @@ async def test():
     print("First insert:", result1)
     print("Second insert:", result2)
 
-asyncio.run(test())
+
+if __name__ == "__main__":
+    asyncio.run(test())
@@ -46,4 +46,6 @@ async def test_repo():
         result = await repo.get_by_id(db, event.id, TEST_TENANT_ID)
         print("Found:", result.name)
 
-asyncio.run(test_repo())
+
+if __name__ == "__main__":
+    asyncio.run(test_repo())
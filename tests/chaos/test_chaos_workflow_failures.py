@@ -4,19 +4,17 @@ System must: fail gracefully, classify failure, maintain audit integrity, not co
 """
 
 import pytest
-from unittest.mock import AsyncMock
 
 from app.observability.failure_classifier import FailureClassifier
 from app.observability.metrics import MetricsCollector
 from app.workflows.langgraph.state_models import RiskState
 from app.workflows.langgraph.risk_workflow import RiskWorkflow
+from tests.helpers.audit import CountingAuditLogger
 
 
 @pytest.fixture
 def audit_logger():
-    audit = AsyncMock()
-    audit.log_action = AsyncMock(return_value=None)
-    return audit
+    return CountingAuditLogger()
 
 
 @pytest.mark.asyncio
@@ -44,6 +42,7 @@ async def test_workflow_failure_classified(audit_logger):
     assert result.event_id == "chaos-1"
     out = metrics.export_metrics()
     assert out["counters"].get("workflow_execution_count", 0) >= 1
+    assert audit_logger.count == 5  # one record per node
 
 
 @pytest.mark.asyncio
@@ -1 +1,31 @@
-"""Pytest configuration and shared fixtures."""
+"""Pytest configuration and shared fixtures. Async tests run on uvloop when installed."""
+
+import sys
+
+import pytest
+import pytest_asyncio.plugin
+
+try:
+    import uvloop
+except ImportError:  # optional; tests fall back to the default asyncio loop
+    uvloop = None
+
+UVLOOP_AVAILABLE = uvloop is not None and sys.platform != "win32"
+# pytest-asyncio >= 1.4 picks loops through a hook and deprecates overriding event_loop_policy.
+HAS_LOOP_FACTORIES_HOOK = hasattr(
+    getattr(pytest_asyncio.plugin, "PytestAsyncioSpecs", None), "pytest_asyncio_loop_factories"
+)
+
+if UVLOOP_AVAILABLE:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Give every async test (and async fixture) a uvloop event loop."""
+        return {"uvloop": uvloop.new_event_loop}
+
+    if not HAS_LOOP_FACTORIES_HOOK:
+
+        @pytest.fixture(scope="session")
+        def event_loop_policy():
+            """Older pytest-asyncio: select uvloop through the loop policy instead."""
+            return uvloop.EventLoopPolicy()
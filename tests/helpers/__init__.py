@@ -0,0 +1 @@
+"""Shared test helpers (importable from any test package)."""
@@ -0,0 +1,48 @@
+"""Audit stand-ins for load, chaos and workflow tests."""
+
+from typing import Any
+
+from app.governance.audit_models import AuditRecord
+
+
+class CountingAuditLogger:
+    """
+    Duck-types AuditLogger (enabled, log_action, log_actions_bulk) without AsyncMock's
+    per-call recording; only counts records. For tests that run hundreds of workflows
+    and never inspect audit calls.
+    """
+
+    __slots__ = ("count",)
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    async def log_action(self, **kwargs: Any) -> None:
+        self.count += 1
+
+    async def log_actions_bulk(self, entries: list[dict[str, Any]]) -> None:
+        self.count += len(entries)
+
+
+class InMemoryAuditRepository:
+    """
+    Plain AuditRepository (save / save_many) with no AsyncMock. records holds every
+    persisted record; save_calls and save_many_calls keep the per-method calls for assertions.
+    """
+
+    __slots__ = ("records", "save_calls", "save_many_calls")
+
+    def __init__(self) -> None:
+        self.records: list[AuditRecord] = []
+        self.save_calls: list[AuditRecord] = []
+        self.save_many_calls: list[list[AuditRecord]] = []
+
+    async def save(self, record: AuditRecord) -> None:
+        self.save_calls.append(record)
+        self.records.append(record)
+
+    async def save_many(self, records: list[AuditRecord]) -> None:
+        self.save_many_calls.append(records)
+        self.records.extend(records)
@@ -0,0 +1,34 @@
+"""Bounded fan-out for load tests."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable
+
+
+async def bounded_gather(
+    factories: Iterable[Callable[[], Awaitable[Any]]],
+    limit: int = 64,
+    *,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """
+    Await factory() for every factory with at most `limit` in flight; results in input order.
+    Runs `limit` worker coroutines that pull from a shared iterator, so only `limit` tasks
+    exist at once instead of one per request. Factories (not pre-created coroutines) so
+    nothing starts, or is timed, before a worker picks it up.
+    return_exceptions: as in asyncio.gather; otherwise the first exception propagates.
+    """
+    factories = list(factories)
+    results: list[Any] = [None] * len(factories)
+    pending = iter(enumerate(factories))
+
+    async def worker() -> None:
+        for i, factory in pending:
+            try:
+                results[i] = await factory()
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results[i] = e
+
+    await asyncio.gather(*(worker() for _ in range(min(limit, len(factories)))))
+    return results
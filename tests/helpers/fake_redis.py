@@ -0,0 +1,34 @@
+"""In-memory stand-in for RedisClient, shared by the API, state store and load tests."""
+
+
+class FakeRedis:
+    """
+    In-memory Redis for tests: the RedisClient methods the API and the workflow state
+    store use, over one dict. TTLs are accepted and ignored.
+    """
+
+    __slots__ = ("_store",)
+
+    def __init__(self):
+        self._store: dict[str, str] = {}
+
+    async def get_cache(self, key: str):
+        return self._store.get(key)
+
+    async def set_cache(self, key: str, value: str, ttl: int = 300):
+        self._store[key] = value
+
+    async def mget_cache(self, keys: list[str]):
+        return [self._store.get(k) for k in keys]
+
+    async def set_cache_many(self, items: dict[str, str], ttl: int = 300):
+        self._store.update(items)
+
+    async def set_idempotency_key(self, key: str, ttl: int = 3600):
+        # One dict op, like SET NX: the store only grows if the key was absent.
+        size = len(self._store)
+        self._store.setdefault(key, "1")
+        return len(self._store) != size
+
+    async def exists(self, key: str):
+        return 1 if key in self._store else 0
@@ -5,80 +5,75 @@ Asserts: no data corruption, no cross-tenant leakage, no deadlocks.
 Uses test app with fake Redis and mock publisher (no real infra).
 """
 
-import asyncio
+import json
+import statistics
 import time
+from array import array
+from functools import partial
 from unittest.mock import AsyncMock
 
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
 from app.api import dependencies
 from app.main import app
-
-
-class FakeRedis:
-    def __init__(self):
-        self._store: dict[str, str] = {}
-
-    async def get_cache(self, key: str):
-        return self._store.get(key)
-
-    async def set_cache(self, key: str, value: str, ttl: int = 300):
-        self._store[key] = value
-
-    async def set_idempotency_key(self, key: str, ttl: int = 3600):
-        if key not in self._store:
-            self._store[key] = "1"
-            return True
-        return False
-
-    async def exists(self, key: str):
-        return 1 if key in self._store else 0
-
-
-@pytest.fixture
-def load_test_client():
-    """App with fake Redis and mock publisher for load tests."""
+from tests.helpers.asgi import call_asgi
+from tests.helpers.concurrency import bounded_gather
+from tests.helpers.fake_redis import FakeRedis
+
+try:
+    from orjson import loads as _loads  # optional; several times faster on small bodies
+except ImportError:
+    _loads = json.loads
+
+pytestmark = pytest.mark.load
+
+
+@pytest_asyncio.fixture(scope="module")
+async def load_test_client():
+    """
+    App with fake Redis and mock publisher for load tests. One client, transport and set
+    of overrides for the whole module; module (not session) scope so the overrides never
+    overlap the API unit tests, which install and clear their own. The client is closed
+    before the overrides are removed.
+    """
     fake_redis = FakeRedis()
     mock_publisher = AsyncMock()
     mock_publisher.publish = AsyncMock(return_value=None)
     app.dependency_overrides[dependencies.get_redis_client] = lambda: fake_redis
     app.dependency_overrides[dependencies.get_publisher] = lambda: mock_publisher
-    transport = ASGITransport(app=app)
-    client = AsyncClient(transport=transport, base_url="http://test")
-    yield client
-    app.dependency_overrides.clear()
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
 
 
 @pytest.mark.asyncio
 async def test_load_health_throughput(load_test_client):
-    """Many concurrent GET /health; measure throughput and latency."""
+    """Many concurrent GET /health; measure throughput and latency of the app itself."""
     num_requests = 500
-    latencies: list[float] = []
-    errors = 0
-
-    async def one_request():
-        t0 = time.perf_counter()
-        try:
-            r = await load_test_client.get(
-                "/health",
-                headers={"X-Tenant-ID": "load-tenant", "X-Correlation-ID": "load-corr"},
-            )
-            latencies.append((time.perf_counter() - t0) * 1000)
-            assert r.status_code == 200
-            return r.json()
-        except Exception:
-            nonlocal errors
-            errors += 1
-            raise
-
-    tasks = [one_request() for _ in range(num_requests)]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    ok = sum(1 for r in results if not isinstance(r, Exception))
-    assert ok == num_requests
-    assert errors == 0
-    assert len(latencies) == num_requests
-    assert sum(latencies) / len(latencies) < 500  # avg latency under 500ms
+    # One preallocated integer slot per request (ns); p95 catches tail regressions a mean hides.
+    latencies_ns = array("q", [0]) * num_requests
+    headers = {"X-Tenant-ID": "load-tenant", "X-Correlation-ID": "load-corr"}
+
+    async def one_request(idx: int):
+        # Straight to the ASGI app (overrides installed by load_test_client): measures the
+        # app, not httpx's client pipeline.
+        t0 = time.perf_counter_ns()
+        status, _, body = await call_asgi(app, "GET", "/health", headers)
+        latencies_ns[idx] = time.perf_counter_ns() - t0
+        assert status == 200
+        return _loads(body)
+
+    # Bounded fan-out: latency is measured per request, not queueing behind 500 tasks.
+    # Any failed request propagates with its own traceback.
+    results = await bounded_gather([partial(one_request, i) for i in range(num_requests)])
+    assert len(results) == num_requests
+    assert min(latencies_ns) > 0  # every request recorded
+    p95_ms = statistics.quantiles(latencies_ns, n=100)[94] / 1e6
+    assert p95_ms < 500  # p95 latency under 500ms
 
 
 @pytest.mark.asyncio
@@ -86,22 +81,15 @@ async def test_load_multi_tenant_no_leakage(load_test_client):
     """Multiple tenants hitting health; responses must reflect correct tenant."""
     tenants = [f"tenant-{i}" for i in range(10)]
     per_tenant = 20
+    # Built once per tenant; the middleware generates the correlation ID per request.
+    headers = {t: {"X-Tenant-ID": t} for t in tenants}
 
-    async def one(tenant_id: str, i: int):
-        r = await load_test_client.get(
-            "/health",
-            headers={
-                "X-Tenant-ID": tenant_id,
-                "X-Correlation-ID": f"corr-{i}",
-            },
-        )
+    async def one(tenant_id: str):
+        r = await load_test_client.get("/health", headers=headers[tenant_id])
         assert r.status_code == 200
-        data = r.json()
+        data = _loads(r.content)
         assert data.get("tenant_id") == tenant_id
         return data["tenant_id"]
 
-    tasks = [one(t, i) for i in range(per_tenant) for t in tenants]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    assert all(not isinstance(r, Exception) for r in results)
-    tenant_ids = [r for r in results if isinstance(r, str)]
+    tenant_ids = await bounded_gather([partial(one, t) for _ in range(per_tenant) for t in tenants])
     assert len(tenant_ids) == 10 * per_tenant
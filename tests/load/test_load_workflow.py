@@ -5,8 +5,10 @@ Asserts: no data corruption, no cross-tenant leakage, no deadlocks, no race cond
 """
 
 import asyncio
+import statistics
 import time
-from unittest.mock import AsyncMock
+from array import array
+from functools import partial
 
 import pytest
 
@@ -17,25 +19,41 @@ from app.scalability.rate_limiter import InMemoryRateLimitBackend, TenantRateLim
 from app.scalability.workload_partitioning import WorkloadPartitioner
 from app.workflows.langgraph.risk_workflow import RiskWorkflow
 from app.workflows.langgraph.state_models import RiskState
+from tests.helpers.audit import CountingAuditLogger
+from tests.helpers.concurrency import bounded_gather
+
+pytestmark = pytest.mark.load
+
+
+# Correlation IDs built once at import; _make_state indexes instead of formatting.
+_CORR_IDS = tuple(f"corr-{i}" for i in range(1024))
+
+# Validated once; per-request states are shallow copies with the identity fields replaced.
+_TEMPLATE = RiskState(
+    event_id="",
+    tenant_id="",
+    correlation_id="",
+    raw_event={"event_type": "load_test"},
+    model_version="simulated@1",
+    prompt_version=1,
+    audit_trail=[],
+)
 
 
 def _make_state(event_id: str, tenant_id: str, i: int) -> RiskState:
-    return RiskState(
-        event_id=event_id,
-        tenant_id=tenant_id,
-        correlation_id=f"corr-{i}",
-        raw_event={"event_type": "load_test", "index": i},
-        model_version="simulated@1",
-        prompt_version=1,
-        audit_trail=[],
+    return _TEMPLATE.model_copy(
+        update={
+            "event_id": event_id,
+            "tenant_id": tenant_id,
+            "correlation_id": _CORR_IDS[i],
+            "raw_event": {"event_type": "load_test", "index": i},
+        }
     )
 
 
 @pytest.fixture
 def audit_logger():
-    audit = AsyncMock()
-    audit.log_action = AsyncMock(return_value=None)
-    return audit
+    return CountingAuditLogger()
 
 
 @pytest.mark.asyncio
@@ -51,42 +69,44 @@ async def test_load_workflow_concurrent_multi_tenant(audit_logger):
     )
     num_tenants = 5
     total_requests = 250
-    latencies: list[float] = []
+    latencies_ns = array("q", [0]) * total_requests  # slot per request ordinal
     tenant_results: dict[str, list[str]] = {f"t{k}": [] for k in range(num_tenants)}
+    prefixes = {t: f"evt-{t}-" for t in tenant_results}
 
     async def run_one(tenant_id: str, i: int):
-        event_id = f"evt-{tenant_id}-{i}"
+        event_id = f"{prefixes[tenant_id]}{i}"
         state = _make_state(event_id, tenant_id, i)
-        t0 = time.perf_counter()
+        t0 = time.perf_counter_ns()
         result = await workflow.run(state)
-        latencies.append((time.perf_counter() - t0) * 1000)
+        latencies_ns[i] = time.perf_counter_ns() - t0
         tenant_results[tenant_id].append(result.event_id)
         return result.event_id
 
-    task_list = [
-        run_one(f"t{i % num_tenants}", i)
-        for i in range(total_requests)
-    ]
-    results = await asyncio.gather(*task_list, return_exceptions=True)
+    # A failed run propagates with its own traceback instead of being counted.
+    results = await bounded_gather(
+        [partial(run_one, f"t{i % num_tenants}", i) for i in range(total_requests)]
+    )
 
-    completed = sum(1 for r in results if not isinstance(r, Exception))
-    assert completed == total_requests
-    for tenant_id, event_ids in tenant_results.items():
-        for eid in event_ids:
-            assert eid.startswith(f"evt-{tenant_id}-"), f"cross-tenant leakage: {eid} in {tenant_id}"
-    assert len(latencies) == completed
-    assert len(latencies) >= 200
+    assert len(results) == total_requests
+    leaked = [
+        (tenant_id, eid)
+        for tenant_id, event_ids in tenant_results.items()
+        for eid in event_ids
+        if not eid.startswith(prefixes[tenant_id])
+    ]
+    assert not leaked, f"cross-tenant leakage: {leaked}"
+    assert min(latencies_ns) > 0  # every run recorded
+    p95_ms = statistics.quantiles(latencies_ns, n=100)[94] / 1e6
+    assert p95_ms < 500  # p95 run latency under 500ms
+    assert audit_logger.count == 5 * total_requests
 
 
 @pytest.mark.asyncio
 async def test_load_bulkhead_no_deadlock():
     """Bulkhead under load: no deadlocks."""
     bulk = BulkheadExecutor(max_concurrent=10, max_queued=100)
-    results = await asyncio.gather(
-        *[bulk.submit(asyncio.sleep, 0.01) for _ in range(50)],
-        return_exceptions=True,
-    )
-    assert not any(isinstance(r, Exception) for r in results)
+    results = await asyncio.gather(*[bulk.submit(asyncio.sleep, 0.01) for _ in range(50)])
+    assert len(results) == 50
 
 
 @pytest.mark.asyncio
@@ -94,12 +114,11 @@ async def test_load_rate_limiter_burst():
     """Rate limiter under burst: some allowed, some denied; no corruption."""
     backend = InMemoryRateLimitBackend()
     limiter = TenantRateLimiter(backend=backend, requests_per_window=100, window_seconds=60)
-    outcomes = await asyncio.gather(
-        *[limiter.allow_request("burst-tenant") for _ in range(150)],
-        return_exceptions=True,
-    )
-    allowed = sum(1 for o in outcomes if o is True)
-    denied = sum(1 for o in outcomes if o is False)
+    # The in-memory backend never blocks, so a sequential loop exercises the same
+    # counting without scheduling 150 tasks.
+    outcomes = [await limiter.allow_request("burst-tenant") for _ in range(150)]
+    allowed = outcomes.count(True)
+    denied = outcomes.count(False)
     assert allowed == 100
     assert denied == 50
 
@@ -108,7 +127,8 @@ async def test_load_rate_limiter_burst():
 async def test_load_partitioning_deterministic():
     """Workload partitioning: deterministic under many tenants."""
     p = WorkloadPartitioner(num_partitions=32)
-    for _ in range(1000):
-        tid = f"tenant-{_}"
-        part = p.get_partition(tid)
-        assert p.get_partition(tid) == part
+    expected = {f"tenant-{i}": p.get_partition(f"tenant-{i}") for i in range(1000)}
+    # A fresh instance stands in for a restarted process: the mapping is content-hashed
+    # (sha256), not hash(), so it must not depend on the instance or PYTHONHASHSEED.
+    fresh = WorkloadPartitioner(num_partitions=32)
+    assert all(fresh.get_partition(k) == v for k, v in expected.items())
@@ -3,39 +3,19 @@
 from unittest.mock import AsyncMock
 
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
 from app.main import app
+from tests.helpers.fake_redis import FakeRedis
 
 
-class FakeRedis:
-    """In-memory Redis for unit tests."""
-
-    def __init__(self):
-        self._store: dict[str, str] = {}
-
-    async def get_cache(self, key: str):
-        return self._store.get(key)
-
-    async def set_cache(self, key: str, value: str, ttl: int = 300):
-        self._store[key] = value
-
-    async def set_idempotency_key(self, key: str, ttl: int = 3600):
-        if key not in self._store:
-            self._store[key] = "1"
-            return True
-        return False
-
-    async def exists(self, key: str):
-        return 1 if key in self._store else 0
-
-
-@pytest.fixture
+@pytest.fixture(scope="package")
 def fake_redis():
     return FakeRedis()
 
 
-@pytest.fixture
+@pytest.fixture(scope="package")
 def mock_publisher():
     """Mock RabbitMQ publisher so tests do not connect to real broker."""
     p = AsyncMock()
@@ -43,9 +23,12 @@ def mock_publisher():
     return p
 
 
-@pytest.fixture
+@pytest.fixture(scope="package")
 def app_with_overrides(fake_redis, mock_publisher):
-    """App with Redis and publisher overridden for testing."""
+    """
+    App with Redis and publisher overridden for testing. Installed once for the API test
+    package and cleared at its teardown; per-test isolation comes from _reset_fakes.
+    """
     from app.api import dependencies
 
     app.dependency_overrides[dependencies.get_redis_client] = lambda: fake_redis
@@ -54,9 +37,16 @@ def app_with_overrides(fake_redis, mock_publisher):
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
-async def async_client(app_with_overrides):
-    """Async HTTP client for testing; uses overridden app."""
+@pytest.fixture(autouse=True)
+def _reset_fakes(fake_redis, mock_publisher):
+    """Each test starts with an empty fake Redis and a fresh publisher mock."""
+    fake_redis._store.clear()
+    mock_publisher.reset_mock()
+
+
+@pytest_asyncio.fixture
+async def client(app_with_overrides):
+    """Async HTTP client for testing; uses overridden app. Shared by all API test modules."""
     transport = ASGITransport(app=app_with_overrides)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
@@ -64,4 +54,4 @@ async def async_client(app_with_overrides):
 
 @pytest.fixture
 def tenant_headers():
-    return {"X-Tenant-ID": "test-tenant-1"}
+    return {"X-Tenant-ID": "test-tenant"}
@@ -0,0 +1,62 @@
+"""Idempotency and validation behaviour shared by POST /events, /risk and /compliance."""
+
+import pytest
+from httpx import AsyncClient
+
+# (endpoint, valid body, invalid body)
+ENDPOINTS = [
+    pytest.param(
+        "/events/",
+        {"tenant_id": "test-tenant", "version": "1.0"},
+        {"tenant_id": "test-tenant", "version": ""},
+        id="events",
+    ),
+    pytest.param(
+        "/risk/",
+        {"tenant_id": "test-tenant", "version": "1.0", "risk_score": 50},
+        {"tenant_id": "test-tenant", "version": "1.0", "risk_score": -1},
+        id="risk",
+    ),
+    pytest.param(
+        "/compliance/",
+        {"tenant_id": "test-tenant", "version": "1.0"},
+        {"tenant_id": "test-tenant", "version": ""},
+        id="compliance",
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("endpoint,body,invalid_body", ENDPOINTS)
+async def test_idempotency_returns_cached(
+    client: AsyncClient, tenant_headers, endpoint, body, invalid_body
+):
+    """Second POST with the same idempotency key returns the first response."""
+    headers = {**tenant_headers, "X-Idempotency-Key": f"idem-{endpoint}"}
+    r1 = await client.post(endpoint, json=body, headers=headers)
+    r2 = await client.post(endpoint, json=body, headers=headers)
+    assert r1.status_code == 200 and r2.status_code == 200
+    assert r1.json()["event_id"] == r2.json()["event_id"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("endpoint,body,invalid_body", ENDPOINTS)
+async def test_validation_failure_returns_422(
+    client: AsyncClient, tenant_headers, endpoint, body, invalid_body
+):
+    """Invalid payload (empty version, negative risk_score) returns 422."""
+    headers = {**tenant_headers, "X-Idempotency-Key": f"invalid-{endpoint}"}
+    r = await client.post(endpoint, json=invalid_body, headers=headers)
+    assert r.status_code == 422
+    assert "detail" in r.json()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("endpoint,body,invalid_body", ENDPOINTS)
+async def test_missing_idempotency_key_returns_400(
+    client: AsyncClient, tenant_headers, endpoint, body, invalid_body
+):
+    """POST without X-Idempotency-Key returns 400."""
+    r = await client.post(endpoint, json=body, headers=tenant_headers)
+    assert r.status_code == 400
+    assert "detail" in r.json()
@@ -1,21 +1,7 @@
-"""Tests for events API: idempotency, validation, missing idempotency header."""
+"""Tests for events API: create, get by id, not found. Shared idempotency/validation cases: test_endpoints_parametrized.py."""
 
 import pytest
-from httpx import ASGITransport, AsyncClient
-
-from app.main import app
-
-
-@pytest.fixture
-async def client(app_with_overrides):
-    transport = ASGITransport(app=app_with_overrides)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
-
-
-@pytest.fixture
-def tenant_headers():
-    return {"X-Tenant-ID": "test-tenant"}
+from httpx import AsyncClient
 
 
 @pytest.mark.asyncio
@@ -35,38 +21,6 @@ async def test_events_idempotency_first_call_stores(client: AsyncClient, tenant_
     assert data["status"] == "received"
 
 
-@pytest.mark.asyncio
-async def test_events_idempotency_second_call_returns_cached(client: AsyncClient, tenant_headers):
-    """Second POST /events with same idempotency key returns cached response."""
-    headers = {**tenant_headers, "X-Idempotency-Key": "key-2"}
-    body = {"tenant_id": "test-tenant", "version": "1.0"}
-    r1 = await client.post("/events/", json=body, headers=headers)
-    assert r1.status_code == 200
-    first_event_id = r1.json()["event_id"]
-    r2 = await client.post("/events/", json=body, headers=headers)
-    assert r2.status_code == 200
-    assert r2.json()["event_id"] == first_event_id
-
-
-@pytest.mark.asyncio
-async def test_events_validation_error_returns_422(client: AsyncClient, tenant_headers):
-    """Invalid payload (e.g. empty version) returns 422."""
-    headers = {**tenant_headers, "X-Idempotency-Key": "key-422"}
-    body = {"tenant_id": "test-tenant", "version": ""}
-    r = await client.post("/events/", json=body, headers=headers)
-    assert r.status_code == 422
-    assert "detail" in r.json()
-
-
-@pytest.mark.asyncio
-async def test_events_missing_idempotency_header_returns_400(client: AsyncClient, tenant_headers):
-    """POST /events without X-Idempotency-Key returns 400."""
-    body = {"tenant_id": "test-tenant", "version": "1.0"}
-    r = await client.post("/events/", json=body, headers=tenant_headers)
-    assert r.status_code == 400
-    assert "detail" in r.json()
-
-
 @pytest.mark.asyncio
 async def test_events_get_not_found_returns_404(client: AsyncClient, tenant_headers):
     """GET /events/{event_id} with non-existent id returns 404."""
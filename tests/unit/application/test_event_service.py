@@ -10,70 +10,63 @@ from app.application.event_service import EventService
 from app.application.exceptions import MessagingFailureError
 from app.domain.models.event import EventStatus, RiskEvent
 
+pytestmark = pytest.mark.asyncio
 
-def _risk_event(
-    event_id: str = "evt-123",
-    tenant_id: str = "tenant-1",
-    status: EventStatus = EventStatus.CREATED,
-) -> RiskEvent:
-    return RiskEvent(
-        event_id=event_id,
-        tenant_id=tenant_id,
-        status=status,
-        created_at=datetime.now(timezone.utc),
-        metadata={"version": "1.0"},
-        risk_score=50.0,
-        category="fraud",
-    )
 
+# One timestamp for the module; no test asserts on its value.
+_NOW = datetime.now(timezone.utc)
 
-def _persisted(event_id: str = "evt-123", tenant_id: str = "tenant-1") -> PersistedEvent:
-    return PersistedEvent(
-        event_id=event_id,
-        tenant_id=tenant_id,
-        correlation_id="corr-1",
-        status=EventStatus.RECEIVED,
-        created_at=datetime.now(timezone.utc),
-        metadata={"version": "1.0"},
-        version="1.0",
-    )
+# Shared canonical instances: validated once at import, only ever read by the service.
+_RISK_EVENT_DEFAULT = RiskEvent(
+    event_id="evt-123",
+    tenant_id="tenant-1",
+    status=EventStatus.CREATED,
+    created_at=_NOW,
+    metadata={"version": "1.0"},
+    risk_score=50.0,
+    category="fraud",
+)
+
+_PERSISTED_DEFAULT = PersistedEvent(
+    event_id="evt-123",
+    tenant_id="tenant-1",
+    correlation_id="corr-1",
+    status=EventStatus.RECEIVED,
+    created_at=_NOW,
+    metadata={"version": "1.0"},
+    version="1.0",
+)
 
 
-@pytest.fixture
+# The mock graph is built once per module; _reset restores it before every test.
+
+
+@pytest.fixture(scope="module")
 def repository():
-    r = AsyncMock()
-    r.save = AsyncMock(return_value=_persisted())
-    return r
+    return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def publisher():
-    p = AsyncMock()
-    p.publish = AsyncMock(return_value=None)
-    return p
+    return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def redis_client():
-    r = AsyncMock()
-    r.get_cache = AsyncMock(return_value=None)
-    r.set_cache = AsyncMock(return_value=None)
-    return r
+    return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def workflow_trigger():
-    w = AsyncMock()
-    w.start = AsyncMock(return_value=None)
-    return w
+    return AsyncMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def logger():
     return MagicMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def event_service(repository, publisher, redis_client, workflow_trigger, logger):
     return EventService(
         repository=repository,
@@ -84,6 +77,18 @@ def event_service(repository, publisher, redis_client, workflow_trigger, logger)
     )
 
 
+@pytest.fixture(autouse=True)
+def _reset(repository, publisher, redis_client, workflow_trigger, logger):
+    """Clear calls, return values and side effects, then reinstall the defaults."""
+    for m in (repository, publisher, redis_client, workflow_trigger, logger):
+        m.reset_mock(return_value=True, side_effect=True)
+    repository.save.return_value = _PERSISTED_DEFAULT
+    publisher.publish.return_value = None
+    redis_client.get_cache.return_value = None
+    redis_client.set_cache.return_value = None
+    workflow_trigger.start.return_value = None
+
+
 # ---------- 1. Happy path ----------
 
 
@@ -96,7 +101,7 @@ async def test_create_event_happy_path(
     logger,
 ):
     """No idempotency key exists; event persisted, published, workflow triggered, audit logged, Redis cached."""
-    event = _risk_event()
+    event = _RISK_EVENT_DEFAULT
     redis_client.get_cache.return_value = None
 
     response = await event_service.create_event(
@@ -134,14 +139,14 @@ async def test_create_event_idempotent_replay_returns_cached(
         event_id="cached-id",
         tenant_id="tenant-1",
         status=EventStatus.RECEIVED,
-        created_at=datetime.now(timezone.utc),
+        created_at=_NOW,
         metadata={},
         version="1.0",
     )
     redis_client.get_cache.return_value = cached.model_dump_json()
 
     response = await event_service.create_event(
-        event=_risk_event(),
+        event=_RISK_EVENT_DEFAULT,
         tenant_id="tenant-1",
         idempotency_key="key-1",
         correlation_id="corr-1",
@@ -168,7 +173,7 @@ async def test_create_event_messaging_failure_raises_and_does_not_cache(
 
     with pytest.raises(MessagingFailureError) as exc_info:
         await event_service.create_event(
-            event=_risk_event(),
+            event=_RISK_EVENT_DEFAULT,
             tenant_id="tenant-1",
             idempotency_key="key-1",
             correlation_id="corr-1",
@@ -193,7 +198,7 @@ async def test_create_event_repository_failure_publisher_and_workflow_not_called
 
     with pytest.raises(Exception) as exc_info:
         await event_service.create_event(
-            event=_risk_event(),
+            event=_RISK_EVENT_DEFAULT,
             tenant_id="tenant-1",
             idempotency_key="key-1",
             correlation_id="corr-1",
@@ -218,7 +223,7 @@ async def test_create_event_workflow_failure_returns_success(
     workflow_trigger.start.side_effect = Exception("Workflow error")
 
     response = await event_service.create_event(
-        event=_risk_event(),
+        event=_RISK_EVENT_DEFAULT,
         tenant_id="tenant-1",
         idempotency_key="key-1",
         correlation_id="corr-1",
@@ -0,0 +1,61 @@
+"""In-memory governance repositories for unit tests (plain classes, no AsyncMock)."""
+
+from app.governance.approval_workflow import ApprovalRequest
+from app.governance.model_registry import ModelRecord
+from app.governance.prompt_registry import PromptRecord
+
+
+class InMemoryApprovalRepo:
+    """ApprovalRepository keyed by request_id."""
+
+    def __init__(self) -> None:
+        self._store: dict[str, ApprovalRequest] = {}
+
+    async def save(self, r: ApprovalRequest) -> None:
+        self._store[r.request_id] = r
+
+    async def get(self, rid: str):
+        return self._store.get(rid)
+
+
+class InMemoryModelRepo:
+    """ModelRegistryRepository keyed by (model_name, version), plus latest per name."""
+
+    def __init__(self) -> None:
+        self._store: dict[tuple[str, str], ModelRecord] = {}
+        self._latest: dict[str, ModelRecord] = {}
+
+    async def save(self, r: ModelRecord) -> None:
+        self._store[(r.model_name, r.version)] = r
+        self._latest[r.model_name] = r
+
+    async def get(self, name: str, version: str):
+        return self._store.get((name, version))
+
+    async def get_latest(self, name: str):
+        return self._latest.get(name)
+
+
+class InMemoryPromptRepo:
+    """PromptRegistryRepository over an append-only list of versions."""
+
+    def __init__(self) -> None:
+        self._store: list[PromptRecord] = []
+
+    async def save(self, r: PromptRecord) -> None:
+        self._store.append(r)
+
+    async def get(self, pid: str, version: int | None = None):
+        matches = [x for x in self._store if x.prompt_id == pid]
+        if not matches:
+            return None
+        if version is not None:
+            for x in matches:
+                if x.version == version:
+                    return x
+            return None
+        return max(matches, key=lambda x: x.version)
+
+    async def get_versions(self, pid: str):
+        matches = [x for x in self._store if x.prompt_id == pid]
+        return sorted(matches, key=lambda x: x.version, reverse=True)
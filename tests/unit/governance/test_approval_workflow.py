@@ -4,31 +4,20 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock
 
 import pytest
+import pytest_asyncio
 
-from app.governance.approval_workflow import (
-    ApprovalRequest,
-    ApprovalStatus,
-    ApprovalWorkflow,
-)
+from app.governance.approval_workflow import ApprovalStatus, ApprovalWorkflow
 from app.governance.exceptions import InvalidWorkflowStateError
 from app.security.exceptions import AuthorizationError
 from app.security.rbac import RBACService, Role
+from tests.unit.governance._fakes import InMemoryApprovalRepo
+
+pytestmark = pytest.mark.asyncio
 
 
 @pytest.fixture
 def approval_repo():
-    store: dict[str, ApprovalRequest] = {}
-
-    async def save(r: ApprovalRequest) -> None:
-        store[r.request_id] = r
-
-    async def get(rid: str):
-        return store.get(rid)
-
-    repo = AsyncMock()
-    repo.save = save
-    repo.get = get
-    return repo
+    return InMemoryApprovalRepo()
 
 
 @pytest.fixture
@@ -52,9 +41,9 @@ def approval_workflow(approval_repo, audit_logger, rbac):
     )
 
 
-async def test_approval_workflow_enforces_rbac_approver_can_approve(
-    approval_workflow, approval_repo
-):
+@pytest_asyncio.fixture
+async def seeded_workflow(approval_workflow):
+    """Workflow with pending request req-1 (model m1@1, tenant t1) already filed."""
     await approval_workflow.request_approval(
         request_id="req-1",
         resource_type="model",
@@ -63,7 +52,11 @@ async def test_approval_workflow_enforces_rbac_approver_can_approve(
         tenant_id="t1",
         correlation_id="c1",
     )
-    approved = await approval_workflow.approve(
+    return approval_workflow
+
+
+async def test_approval_workflow_enforces_rbac_approver_can_approve(seeded_workflow):
+    approved = await seeded_workflow.approve(
         request_id="req-1",
         approver_role=Role.APPROVER,
         approver_id="approver-1",
@@ -73,19 +66,9 @@ async def test_approval_workflow_enforces_rbac_approver_can_approve(
     assert approved.status == ApprovalStatus.APPROVED
 
 
-async def test_approval_workflow_enforces_rbac_analyst_cannot_approve(
-    approval_workflow, approval_repo
-):
-    await approval_workflow.request_approval(
-        request_id="req-1",
-        resource_type="model",
-        resource_id="m1@1",
-        requested_by="user1",
-        tenant_id="t1",
-        correlation_id="c1",
-    )
+async def test_approval_workflow_enforces_rbac_analyst_cannot_approve(seeded_workflow):
     with pytest.raises(AuthorizationError) as exc_info:
-        await approval_workflow.approve(
+        await seeded_workflow.approve(
             request_id="req-1",
             approver_role=Role.ANALYST,
             approver_id="analyst-1",
@@ -95,19 +78,9 @@ async def test_approval_workflow_enforces_rbac_analyst_cannot_approve(
     assert "approve" in str(exc_info.value.message).lower()
 
 
-async def test_approval_workflow_enforces_rbac_viewer_cannot_approve(
-    approval_workflow, approval_repo
-):
-    await approval_workflow.request_approval(
-        request_id="req-1",
-        resource_type="model",
-        resource_id="m1@1",
-        requested_by="user1",
-        tenant_id="t1",
-        correlation_id="c1",
-    )
+async def test_approval_workflow_enforces_rbac_viewer_cannot_approve(seeded_workflow):
     with pytest.raises(AuthorizationError):
-        await approval_workflow.approve(
+        await seeded_workflow.approve(
             request_id="req-1",
             approver_role=Role.VIEWER,
             approver_id="viewer-1",
@@ -116,18 +89,8 @@ async def test_approval_workflow_enforces_rbac_viewer_cannot_approve(
         )
 
 
-async def test_status_transitions_enforced_cannot_approve_non_pending(
-    approval_workflow, approval_repo
-):
-    await approval_workflow.request_approval(
-        request_id="req-1",
-        resource_type="model",
-        resource_id="m1@1",
-        requested_by="user1",
-        tenant_id="t1",
-        correlation_id="c1",
-    )
-    await approval_workflow.approve(
+async def test_status_transitions_enforced_cannot_approve_non_pending(seeded_workflow):
+    await seeded_workflow.approve(
         request_id="req-1",
         approver_role=Role.ADMIN,
         approver_id="admin",
@@ -135,7 +98,7 @@ async def test_status_transitions_enforced_cannot_approve_non_pending(
         correlation_id="c1",
     )
     with pytest.raises(InvalidWorkflowStateError) as exc_info:
-        await approval_workflow.approve(
+        await seeded_workflow.approve(
             request_id="req-1",
             approver_role=Role.ADMIN,
             approver_id="admin",
@@ -145,17 +108,9 @@ async def test_status_transitions_enforced_cannot_approve_non_pending(
     assert "not pending" in str(exc_info.value.message).lower()
 
 
-async def test_reject_enforces_rbac(approval_workflow, approval_repo):
-    await approval_workflow.request_approval(
-        request_id="req-1",
-        resource_type="model",
-        resource_id="m1@1",
-        requested_by="user1",
-        tenant_id="t1",
-        correlation_id="c1",
-    )
+async def test_reject_enforces_rbac(seeded_workflow):
     with pytest.raises(AuthorizationError):
-        await approval_workflow.reject(
+        await seeded_workflow.reject(
             request_id="req-1",
             rejector_role=Role.VIEWER,
             rejector_id="v1",
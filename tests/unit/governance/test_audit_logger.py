@@ -5,9 +5,11 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from app.governance.audit_logger import AuditLogger
+from app.governance.audit_logger import AuditBatch, AuditLogger
 from app.governance.audit_models import AuditRecord
 
+pytestmark = pytest.mark.asyncio
+
 
 @pytest.fixture
 def audit_repository():
@@ -47,6 +49,7 @@ async def test_audit_immutability(audit_logger, audit_repository):
     # Immutability: frozen dataclass
     with pytest.raises(AttributeError):
         record.actor = "other"  # type: ignore[misc]
+    assert not hasattr(record, "__dict__")
 
 
 async def test_audit_fields_completeness(audit_logger, audit_repository):
@@ -70,3 +73,62 @@ async def test_audit_fields_completeness(audit_logger, audit_repository):
     d = record.to_dict()
     assert "timestamp_utc" in d
     assert "actor" in d and "action" in d and "reason" in d and "correlation_id" in d
+
+
+async def test_audit_batch_flushes_in_one_bulk_call(audit_logger, audit_repository):
+    """AuditBatch buffers entries (timestamped at log time) and writes them via save_many."""
+    batch = AuditBatch()
+    for action in ("a1", "a2"):
+        await batch.log_action(
+            actor="workflow",
+            tenant_id="t1",
+            action=action,
+            resource_type="workflow",
+            resource_id="evt-1",
+            reason=None,
+            correlation_id="corr-1",
+            metadata={"k": action},
+        )
+    assert len(batch) == 2
+    audit_repository.save_many.assert_not_awaited()
+    await batch.flush(audit_logger)
+    assert len(batch) == 0
+    audit_repository.save_many.assert_awaited_once()
+    records = audit_repository.save_many.call_args[0][0]
+    assert [r.action for r in records] == ["a1", "a2"]
+    assert all(isinstance(r, AuditRecord) and r.timestamp_utc.tzinfo == timezone.utc for r in records)
+
+
+async def test_log_actions_bulk_falls_back_to_save():
+    """Repositories without save_many get one save() per record."""
+
+    class SaveOnlyRepo:
+        def __init__(self):
+            self.saved = []
+
+        async def save(self, record):
+            self.saved.append(record)
+
+    repo = SaveOnlyRepo()
+    entry = dict(
+        actor="a", tenant_id="t1", action="x", resource_type="r", resource_id="id",
+        reason=None, correlation_id="c", metadata=None,
+    )
+    await AuditLogger(repository=repo).log_actions_bulk([entry, {**entry, "action": "y"}])
+    assert [r.action for r in repo.saved] == ["x", "y"]
+
+
+async def test_disabled_audit_logger_writes_nothing(audit_repository):
+    """enabled=False: log_action, log_actions_bulk and a disabled batch are all no-ops."""
+    audit = AuditLogger(repository=audit_repository, enabled=False)
+    entry = dict(
+        actor="a", tenant_id="t1", action="x", resource_type="r", resource_id="id",
+        reason=None, correlation_id="c", metadata=None,
+    )
+    await audit.log_action(**entry)
+    await audit.log_actions_bulk([entry])
+    batch = AuditBatch(enabled=audit.enabled)
+    await batch.log_action(**entry)
+    assert len(batch) == 0
+    audit_repository.save.assert_not_awaited()
+    audit_repository.save_many.assert_not_awaited()
@@ -6,29 +6,15 @@ from unittest.mock import AsyncMock
 import pytest
 
 from app.governance.exceptions import InvalidModelStateError, ModelNotApprovedError
-from app.governance.model_registry import ModelRegistry, ModelRecord, ModelStatus
+from app.governance.model_registry import ModelRegistry, ModelStatus
+from tests.unit.governance._fakes import InMemoryModelRepo
+
+pytestmark = pytest.mark.asyncio
 
 
 @pytest.fixture
 def model_repo():
-    repo = AsyncMock()
-    store: dict[tuple[str, str], ModelRecord] = {}
-    latest: dict[str, ModelRecord] = {}
-
-    async def save(r: ModelRecord) -> None:
-        store[(r.model_name, r.version)] = r
-        latest[r.model_name] = r
-
-    async def get(name: str, version: str):
-        return store.get((name, version))
-
-    async def get_latest(name: str):
-        return latest.get(name)
-
-    repo.save = save
-    repo.get = get
-    repo.get_latest = get_latest
-    return repo
+    return InMemoryModelRepo()
 
 
 @pytest.fixture
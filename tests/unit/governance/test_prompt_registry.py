@@ -5,36 +5,15 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from app.governance.prompt_registry import PromptRegistry, PromptRecord
+from app.governance.prompt_registry import PromptRegistry
+from tests.unit.governance._fakes import InMemoryPromptRepo
+
+pytestmark = pytest.mark.asyncio
 
 
 @pytest.fixture
 def prompt_repo():
-    store: list[PromptRecord] = []
-
-    async def save(r: PromptRecord) -> None:
-        store.append(r)
-
-    async def get(pid: str, version: int | None = None):
-        matches = [x for x in store if x.prompt_id == pid]
-        if not matches:
-            return None
-        if version is not None:
-            for x in matches:
-                if x.version == version:
-                    return x
-            return None
-        return max(matches, key=lambda x: x.version)
-
-    async def get_versions(pid: str):
-        matches = [x for x in store if x.prompt_id == pid]
-        return sorted(matches, key=lambda x: x.version, reverse=True)
-
-    repo = AsyncMock()
-    repo.save = save
-    repo.get = get
-    repo.get_versions = get_versions
-    return repo
+    return InMemoryPromptRepo()
 
 
 @pytest.fixture
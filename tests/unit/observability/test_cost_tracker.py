@@ -28,10 +28,12 @@ def test_cost_per_model_tracked():
 def test_cost_from_tokens_deterministic():
     """add_cost_from_tokens uses deterministic rate."""
     c = CostTracker(rate_per_1k_tokens=0.002)
-    cost = c.add_cost_from_tokens("t1", 1000, 500, request_id="r1")
-    assert cost == pytest.approx(0.003, rel=1e-5)
-    assert c.get_request_cost("r1") == pytest.approx(0.003, rel=1e-5)
-    assert c.get_tenant_cost("t1") == pytest.approx(0.003, rel=1e-5)
+    # Same float expression as CostTracker (no rounding), so results compare exactly.
+    expected = ((1000 + 500) / 1000.0) * 0.002
+    assert expected == pytest.approx(0.003)
+    assert c.add_cost_from_tokens("t1", 1000, 500, request_id="r1") == expected
+    assert c.get_request_cost("r1") == expected
+    assert c.get_tenant_cost("t1") == expected
 
 
 def test_cost_reset():
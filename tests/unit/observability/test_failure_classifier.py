@@ -13,29 +13,20 @@ from app.observability.failure_classifier import FailureCategory, FailureClassif
 from app.security.exceptions import AuthorizationError
 
 
-def test_classify_validation_error():
-    """DomainValidationError -> VALIDATION_ERROR."""
-    assert FailureClassifier.classify(DomainValidationError("bad")) == FailureCategory.VALIDATION_ERROR
-    assert FailureClassifier.classify(InvalidTenantError("bad")) == FailureCategory.VALIDATION_ERROR
-
-
-def test_classify_policy_violation():
-    """ModelNotApprovedError -> POLICY_VIOLATION."""
-    assert FailureClassifier.classify(ModelNotApprovedError("x")) == FailureCategory.POLICY_VIOLATION
-    assert FailureClassifier.classify(AuthorizationError("x")) == FailureCategory.POLICY_VIOLATION
-
-
-def test_classify_high_risk():
-    """RiskThresholdViolationError -> HIGH_RISK."""
-    assert FailureClassifier.classify(RiskThresholdViolationError("x")) == FailureCategory.HIGH_RISK
-
-
-def test_classify_workflow_error():
-    """IdempotencyConflictError -> WORKFLOW_ERROR."""
-    assert FailureClassifier.classify(IdempotencyConflictError("x")) == FailureCategory.WORKFLOW_ERROR
-
-
-def test_classify_unknown_exception_unexpected():
-    """Unknown exception -> UNEXPECTED_ERROR."""
-    assert FailureClassifier.classify(ValueError("x")) == FailureCategory.UNEXPECTED_ERROR
-    assert FailureClassifier.classify(RuntimeError("x")) == FailureCategory.UNEXPECTED_ERROR
+@pytest.mark.parametrize(
+    "exc, expected",
+    [
+        (DomainValidationError("bad"), FailureCategory.VALIDATION_ERROR),
+        (InvalidTenantError("bad"), FailureCategory.VALIDATION_ERROR),
+        (ModelNotApprovedError("x"), FailureCategory.POLICY_VIOLATION),
+        (AuthorizationError("x"), FailureCategory.POLICY_VIOLATION),
+        (RiskThresholdViolationError("x"), FailureCategory.HIGH_RISK),
+        (IdempotencyConflictError("x"), FailureCategory.WORKFLOW_ERROR),
+        (ValueError("x"), FailureCategory.UNEXPECTED_ERROR),
+        (RuntimeError("x"), FailureCategory.UNEXPECTED_ERROR),
+    ],
+    ids=lambda v: type(v).__name__ if isinstance(v, Exception) else None,
+)
+def test_classify(exc, expected):
+    """Each known exception maps to its category; unknown exceptions -> UNEXPECTED_ERROR."""
+    assert FailureClassifier.classify(exc) is expected
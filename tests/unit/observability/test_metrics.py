@@ -1,5 +1,6 @@
 """MetricsCollector tests: counters, histogram, tenant separation, failure metrics."""
 
+import json
 import threading
 
 import pytest
@@ -26,7 +27,22 @@ def test_metrics_histogram_tracks_latency():
     h = out["histograms"]["request_latency"]
     assert h["count"] == 2
     assert h["sum"] == 30.5
-    assert 10.5 in h["values"] and 20.0 in h["values"]
+    # Percentiles resolve to a bucket bound (~9% wide); the top one is capped at the max seen.
+    assert h["percentiles"]["p50"] == pytest.approx(10.5, rel=0.1)
+    assert h["percentiles"]["p99"] == 20.0
+    assert sum(h["buckets"].values()) == 2
+
+
+def test_metrics_histogram_memory_is_fixed():
+    """Histogram size does not grow with the number of observations."""
+    m = MetricsCollector()
+    for i in range(10_000):
+        m.observe_latency("request_latency", float(i % 100) + 0.5)
+    h = m.export_metrics()["histograms"]["request_latency"]
+    assert h["count"] == 10_000
+    assert len(h["buckets"]) <= 100
+    assert h["percentiles"]["p50"] == pytest.approx(50.0, rel=0.1)
+    assert h["percentiles"]["p99"] == pytest.approx(99.0, rel=0.1)
 
 
 def test_metrics_tenant_metrics_separated():
@@ -80,6 +96,18 @@ def test_metrics_thread_safe():
     assert out["counters"]["workflow_execution_count"] == 1000
 
 
+def test_metrics_export_bytes_matches_export_metrics():
+    """export_bytes is the JSON encoding of export_metrics (bucket bounds become string keys)."""
+    m = MetricsCollector()
+    m.increment("request_count", 2, tenant_id="t1")
+    m.observe_latency("request_latency", 12.5)
+    decoded = json.loads(m.export_bytes())
+    expected = m.export_metrics()
+    hist = expected["histograms"]["request_latency"]
+    hist["buckets"] = {str(k): v for k, v in hist["buckets"].items()}
+    assert decoded == expected
+
+
 def test_metrics_reset():
     """Reset clears all metrics."""
     m = MetricsCollector()
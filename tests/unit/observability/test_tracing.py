@@ -1,8 +1,11 @@
 """TracingService tests: trace ID, span nesting, latency, metadata."""
 
+import asyncio
+
 import pytest
 
-from app.observability.tracing import Span, TracingService
+from app.observability.metrics import MetricsCollector
+from app.observability.tracing import Span, TracingService, should_sample
 
 
 @pytest.mark.asyncio
@@ -32,6 +35,26 @@ async def test_tracing_span_nesting():
     assert len(traces[0].spans) == 2
 
 
+@pytest.mark.asyncio
+async def test_tracing_nested_span_inherits_context():
+    """Without explicit IDs, a nested span (including in a child task) joins the enclosing span."""
+    t = TracingService()
+    async with t.start_span("workflow") as root:
+        async with t.start_span("node_a") as child:
+            pass
+        (other,) = await asyncio.gather(_open_span(t, "node_b"))
+    async with t.start_span("next_request") as sibling:
+        pass
+    assert child.trace_id == other.trace_id == root.trace_id
+    assert child.parent_span_id == other.parent_span_id == root.span_id
+    assert sibling.parent_span_id is None and sibling.trace_id != root.trace_id
+
+
+async def _open_span(t: TracingService, name: str) -> Span:
+    async with t.start_span(name) as span:
+        return span
+
+
 @pytest.mark.asyncio
 async def test_tracing_latency_recorded():
     """Latency recorded on span end."""
@@ -41,6 +64,7 @@ async def test_tracing_latency_recorded():
     assert span.end_time_utc is not None
     assert span.duration_ms is not None
     assert span.duration_ms >= 0
+    assert span.end_time_utc >= span.start_time_utc
 
 
 @pytest.mark.asyncio
@@ -69,3 +93,27 @@ async def test_tracing_reset():
         pass
     t.reset()
     assert len(t.get_traces()) == 0
+
+
+@pytest.mark.asyncio
+async def test_tracing_evicts_oldest_trace_when_full():
+    """Trace store is bounded; evictions are counted and exported as a metric."""
+    metrics = MetricsCollector()
+    t = TracingService(max_traces=2, metrics_collector=metrics)
+    ids = []
+    for name in ("s1", "s2", "s3"):
+        async with t.start_span(name) as span:
+            ids.append(span.trace_id)
+    assert [tr.trace_id for tr in t.get_traces()] == ids[1:]
+    assert t.get_trace(ids[0]) is None
+    assert t.dropped_traces == 1
+    assert metrics.export_metrics()["counters"]["traces_dropped_count"] == 1
+
+
+def test_should_sample_is_deterministic_and_respects_rate():
+    """Same key always gets the same decision; rate bounds are absolute; ~rate of keys sampled."""
+    assert should_sample("c1", 1.0) is True
+    assert should_sample("c1", 0.0) is False
+    assert should_sample("c1", 0.5) == should_sample("c1", 0.5)
+    sampled = sum(should_sample(f"corr-{i}", 0.25) for i in range(2000))
+    assert 350 < sampled < 650
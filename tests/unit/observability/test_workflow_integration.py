@@ -1,7 +1,5 @@
 """Workflow integration tests: observability hooks with RiskWorkflow and ComplianceWorkflow."""
 
-from unittest.mock import AsyncMock
-
 import pytest
 
 from app.observability.cost_tracker import CostTracker
@@ -10,13 +8,12 @@ from app.observability.metrics import MetricsCollector
 from app.observability.tracing import TracingService
 from app.workflows.langgraph.risk_workflow import RiskWorkflow
 from app.workflows.langgraph.state_models import ComplianceState, RiskState
+from tests.helpers.audit import InMemoryAuditRepository
 
 
 @pytest.fixture
 def audit_repository():
-    repo = AsyncMock()
-    repo.save = AsyncMock(return_value=None)
-    return repo
+    return InMemoryAuditRepository()
 
 
 @pytest.fixture
@@ -69,6 +66,8 @@ async def test_risk_workflow_node_latency_recorded(audit_logger, metrics, tracin
     assert "risk_workflow" in node_names
     assert "retrieval" in node_names
     assert "decision" in node_names
+    root = next(s for s in trace.spans if s.name == "risk_workflow")
+    assert all(s.parent_span_id == root.span_id for s in trace.spans if s is not root)
 
 
 @pytest.mark.asyncio
@@ -174,3 +173,48 @@ async def test_compliance_workflow_observability(audit_logger, metrics, tracing)
     out = metrics.export_metrics()
     assert out["counters"].get("workflow_execution_count") == 1
     assert len(tracing.get_traces()) == 1
+
+
+@pytest.mark.asyncio
+async def test_compliance_workflow_unsampled_request_creates_no_spans(audit_logger, tracing):
+    """With tracing_sample_rate=0 no spans are created, and the workflow still completes."""
+    from app.workflows.langgraph.compliance_workflow import ComplianceWorkflow
+
+    workflow = ComplianceWorkflow(
+        audit_logger=audit_logger,
+        tracing_service=tracing,
+        tracing_sample_rate=0.0,
+    )
+    state = ComplianceState(
+        event_id="e1",
+        tenant_id="t1",
+        correlation_id="c1",
+        raw_event={"event_type": "standard"},
+    )
+    out = await workflow.run(state)
+    assert out.final_decision == "APPROVED"
+    assert tracing.get_traces() == []
+
+
+@pytest.mark.asyncio
+async def test_compliance_workflow_langfuse_and_evaluation_tail(audit_logger):
+    """Langfuse generation is logged and evaluation_result is stored when both are configured."""
+    from app.observability.evaluation import EvaluationService
+    from app.observability.langfuse_client import LangfuseClient
+    from app.workflows.langgraph.compliance_workflow import ComplianceWorkflow
+
+    langfuse = LangfuseClient()
+    workflow = ComplianceWorkflow(
+        audit_logger=audit_logger,
+        langfuse_client=langfuse,
+        evaluation_service=EvaluationService(),
+    )
+    state = ComplianceState(
+        event_id="e1",
+        tenant_id="t1",
+        correlation_id="c1",
+        raw_event={"event_type": "standard"},
+    )
+    out = await workflow.run(state)
+    assert len(langfuse.get_generations()) == 1
+    assert out.evaluation_result is not None
@@ -69,3 +69,30 @@ async def test_queue_overflow_raises():
     assert len(errs) >= 1, f"expected at least one queue full error, got {results}"
     assert len(oks) >= 1, f"expected at least one success, got {results}"
     assert all("queue full" in e[1].lower() for e in errs)
+
+
+@pytest.mark.asyncio
+async def test_set_max_concurrent_wakes_waiters():
+    bulk = BulkheadExecutor(max_concurrent=1, max_queued=10)
+    running = 0
+    max_running = 0
+    release = asyncio.Event()
+
+    async def work():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+        return 1
+
+    tasks = [asyncio.create_task(bulk.submit(work)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    assert bulk.active_count == 1
+    assert bulk.queued_count == 2
+    await bulk.set_max_concurrent(3)
+    await asyncio.sleep(0.01)
+    assert bulk.active_count == 3
+    release.set()
+    assert await asyncio.gather(*tasks) == [1, 1, 1]
+    assert max_running == 3
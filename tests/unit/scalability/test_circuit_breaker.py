@@ -71,3 +71,181 @@ async def test_half_open_failure_opens_again():
     with pytest.raises(ValueError):
         await cb.call(fail)
     assert cb.state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_failures_outside_window_do_not_trip():
+    cb = CircuitBreaker(failure_threshold=2, recovery_timeout_seconds=10.0, window_seconds=0.05)
+
+    async def fail():
+        raise ValueError("fail")
+
+    with pytest.raises(ValueError):
+        await cb.call(fail)
+    await asyncio.sleep(0.1)
+    with pytest.raises(ValueError):
+        await cb.call(fail)
+    assert cb.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_low_failure_rate_does_not_trip():
+    cb = CircuitBreaker(failure_threshold=2, recovery_timeout_seconds=10.0, failure_rate_threshold=0.5)
+
+    async def ok():
+        return 1
+
+    async def fail():
+        raise ValueError("fail")
+
+    for _ in range(5):
+        await cb.call(ok)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await cb.call(fail)
+    assert cb.state == CircuitState.CLOSED
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            await cb.call(fail)
+    assert cb.state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_doubles_cooldown_and_success_resets():
+    cb = CircuitBreaker(
+        failure_threshold=1, recovery_timeout_seconds=0.05, max_recovery_timeout_seconds=0.15
+    )
+
+    async def ok():
+        return 1
+
+    async def fail():
+        raise ValueError("fail")
+
+    with pytest.raises(ValueError):
+        await cb.call(fail)
+    await asyncio.sleep(0.06)
+    with pytest.raises(ValueError):
+        await cb.call(fail)  # probe fails: cooldown 0.05 -> 0.1
+    await asyncio.sleep(0.06)
+    with pytest.raises(RuntimeError, match="OPEN"):
+        await cb.call(ok)
+    await asyncio.sleep(0.06)
+    assert await cb.call(ok) == 1
+    assert cb.state == CircuitState.CLOSED
+    assert cb._current_cooldown == 0.05
+
+
+@pytest.mark.asyncio
+async def test_half_open_admits_single_probe():
+    cb = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=0.01)
+    calls = 0
+
+    async def fail():
+        raise ValueError("fail")
+
+    async def slow_ok():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return 1
+
+    with pytest.raises(ValueError):
+        await cb.call(fail)
+    await asyncio.sleep(0.02)
+    results = await asyncio.gather(*(cb.call(slow_ok) for _ in range(5)), return_exceptions=True)
+    assert calls == 1
+    assert results.count(1) == 1
+    assert sum(isinstance(r, RuntimeError) for r in results) == 4
+    assert cb.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_recovering_ramps_admission_before_closing(monkeypatch):
+    cb = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=0.01, recovery_admit_ratio=0.5)
+
+    async def ok():
+        return 1
+
+    async def fail():
+        raise ValueError("fail")
+
+    with pytest.raises(ValueError):
+        await cb.call(fail)
+    await asyncio.sleep(0.02)
+    assert await cb.call(ok) == 1
+    assert cb.state == CircuitState.RECOVERING
+
+    monkeypatch.setattr("app.scalability.circuit_breaker.random.random", lambda: 0.9)
+    with pytest.raises(RuntimeError, match="RECOVERING"):
+        await cb.call(ok)
+    monkeypatch.setattr("app.scalability.circuit_breaker.random.random", lambda: 0.0)
+    assert await cb.call(ok) == 1  # 0.5 -> 0.75
+    assert cb.state == CircuitState.RECOVERING
+    assert await cb.call(ok) == 1  # 0.75 -> 1.0
+    assert cb.state == CircuitState.CLOSED
+
+
+async def _open_with_stale_call(cb, stale):
+    """Start stale() while CLOSED, trip the breaker, wait out the cooldown."""
+
+    async def fail():
+        raise ValueError("fail")
+
+    task = asyncio.create_task(cb.call(stale))
+    await asyncio.sleep(0)
+    with pytest.raises(ValueError):
+        await cb.call(fail)
+    await asyncio.sleep(0.02)
+    return task
+
+
+@pytest.mark.asyncio
+async def test_slow_success_admitted_while_closed_does_not_close_half_open():
+    cb = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=0.01)
+    stale_done, probe_done = asyncio.Event(), asyncio.Event()
+
+    async def stale_ok():
+        await stale_done.wait()
+        return 1
+
+    async def probe_ok():
+        await probe_done.wait()
+        return 2
+
+    stale = await _open_with_stale_call(cb, stale_ok)
+    probe = asyncio.create_task(cb.call(probe_ok))
+    await asyncio.sleep(0)
+    assert cb.state == CircuitState.HALF_OPEN
+    stale_done.set()
+    assert await stale == 1
+    assert cb.state == CircuitState.HALF_OPEN
+    probe_done.set()
+    assert await probe == 2
+    assert cb.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_slow_failure_admitted_while_closed_does_not_reopen_half_open():
+    cb = CircuitBreaker(failure_threshold=1, recovery_timeout_seconds=0.01)
+    stale_done, probe_done = asyncio.Event(), asyncio.Event()
+
+    async def stale_fail():
+        await stale_done.wait()
+        raise ValueError("late")
+
+    async def probe_ok():
+        await probe_done.wait()
+        return 2
+
+    stale = await _open_with_stale_call(cb, stale_fail)
+    probe = asyncio.create_task(cb.call(probe_ok))
+    await asyncio.sleep(0)
+    stale_done.set()
+    with pytest.raises(ValueError, match="late"):
+        await stale
+    assert cb.state == CircuitState.HALF_OPEN
+    assert cb._current_cooldown == 0.01
+    probe_done.set()
+    assert await probe == 2
+    assert cb.state == CircuitState.CLOSED
@@ -1,5 +1,7 @@
 """HealthMonitor: aggregate db, redis, rabbitmq, backlog, circuit breakers, latency."""
 
+import asyncio
+
 import pytest
 
 from app.scalability.health_monitor import HealthMonitor
@@ -51,3 +53,60 @@ async def test_workflow_backlog_and_circuit_states():
     out = await monitor.system_health()
     assert out["workflow_backlog"] == 5
     assert out["circuit_breaker_states"] == {"publisher": "closed"}
+
+
+@pytest.mark.asyncio
+async def test_system_health_cached_within_ttl():
+    """Repeat and concurrent calls within the TTL run the checks once; ttl=0 disables the cache."""
+    calls = 0
+
+    async def db_ok():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return {"status": "ok"}
+
+    monitor = HealthMonitor(db_health=db_ok, cache_ttl_seconds=60)
+    results = await asyncio.gather(*(monitor.system_health() for _ in range(5)))
+    await monitor.system_health()
+    assert calls == 1
+    assert all(r["db"]["status"] == "ok" for r in results)
+
+    # Each caller gets its own copy: mutating one report does not change the cached one.
+    results[0]["status"] = "mutated"
+    results[1]["db"]["status"] = "mutated"
+    again = await monitor.system_health()
+    assert again["status"] == "ok" and again["db"]["status"] == "ok"
+    assert calls == 1
+
+    uncached = HealthMonitor(db_health=db_ok, cache_ttl_seconds=0)
+    await uncached.system_health()
+    await uncached.system_health()
+    assert calls == 3
+
+
+@pytest.mark.asyncio
+async def test_system_health_runs_checks_concurrently():
+    """All async checks are in flight together; one failing does not hide the others."""
+    in_flight = 0
+    peak = 0
+
+    def check(fail: bool = False):
+        async def run():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if fail:
+                raise RuntimeError("timeout")
+            return {"status": "ok"}
+
+        return run
+
+    monitor = HealthMonitor(db_health=check(), redis_health=check(fail=True), rabbitmq_health=check())
+    out = await monitor.system_health()
+    assert peak == 3
+    assert out["db"]["status"] == "ok" and out["rabbitmq"]["status"] == "ok"
+    assert out["redis"] == {"status": "error", "error": "timeout"}
+    assert out["status"] == "degraded"
@@ -1,5 +1,7 @@
 """WorkloadPartitioner: deterministic partition mapping."""
 
+import hashlib
+
 import pytest
 
 from app.scalability.workload_partitioning import WorkloadPartitioner
@@ -12,6 +14,14 @@ def test_get_partition_deterministic():
     assert a == b
 
 
+def test_partition_mapping_is_sha256_mod_n():
+    """Mapping is pinned to sha256 so tenants keep their partition across releases."""
+    p = WorkloadPartitioner(num_partitions=16)
+    for tenant in ("tenant-a", "tenant-b", "t1"):
+        expected = int(hashlib.sha256(tenant.encode("utf-8")).hexdigest(), 16) % 16
+        assert p.get_partition(tenant) == expected
+
+
 def test_different_tenants_different_partitions():
     p = WorkloadPartitioner(num_partitions=16)
     parts = {p.get_partition(f"tenant-{i}") for i in range(50)}
@@ -1,11 +1,16 @@
 """Security tests: encryption round-trip; encryption fails with wrong key."""
 
+import base64
 import os
 from unittest.mock import patch
 
 import pytest
 
-from app.security.encryption import EncryptionService
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+from app.security.encryption import DEFAULT_SALT, EncryptionService
 from app.security.exceptions import EncryptionError
 
 
@@ -47,3 +52,54 @@ def test_encryption_empty_key_raises():
     """Empty string key raises."""
     with pytest.raises(EncryptionError):
         EncryptionService(key="")
+
+
+def test_encryption_accepts_ready_fernet_key():
+    """A urlsafe-b64 32-byte key is used directly (no KDF) and round-trips."""
+    key = Fernet.generate_key().decode("ascii")
+    svc = EncryptionService(key=key)
+    assert svc.decrypt(svc.encrypt("payload")) == "payload"
+
+
+def test_encryption_custom_iterations_round_trip():
+    """Low iteration count (tests) still derives a working key; differs from default."""
+    key = "test-secret-key-at-least-32-chars-long-for-aes"
+    fast = EncryptionService(key=key, iterations=1000)
+    assert fast.decrypt(fast.encrypt("data")) == "data"
+    with pytest.raises(EncryptionError):
+        EncryptionService(key=key).decrypt(fast.encrypt("data"))
+
+
+def _baseline_fernet_token(secret: str, plain: bytes) -> str:
+    """Token as written before the AES-GCM switch: Fernet keyed by PBKDF2(secret), base64-wrapped."""
+    kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=DEFAULT_SALT, iterations=480000)
+    fernet = Fernet(base64.urlsafe_b64encode(kdf.derive(secret.encode("utf-8"))))
+    return base64.urlsafe_b64encode(fernet.encrypt(plain)).decode("ascii")
+
+
+def test_encryption_legacy_fernet_tokens_accepted():
+    """Fernet tokens written before the AES-GCM switch (double- or single-wrapped) still decrypt."""
+    key = "test-secret-key-at-least-32-chars-long-for-aes"
+    legacy = _baseline_fernet_token(key, b"secret")
+    svc = EncryptionService(key=key)
+    assert svc.decrypt(legacy) == "secret"
+    single = base64.urlsafe_b64decode(legacy).decode("ascii")
+    assert svc.decrypt(single) == "secret"
+
+
+def test_encryption_legacy_fernet_tokens_accepted_with_ready_key():
+    """A Fernet-shaped ENCRYPTION_KEY was also run through PBKDF2 before; its tokens still decrypt."""
+    key = Fernet.generate_key().decode("ascii")
+    legacy = _baseline_fernet_token(key, b"secret")
+    assert EncryptionService(key=key).decrypt(legacy) == "secret"
+
+
+def test_encryption_is_nondeterministic_and_tamper_evident():
+    """Fresh nonce per call; flipping a ciphertext byte fails authentication."""
+    svc = EncryptionService(key=Fernet.generate_key().decode("ascii"))
+    a, b = svc.encrypt("same"), svc.encrypt("same")
+    assert a != b
+    blob = bytearray(base64.urlsafe_b64decode(a))
+    blob[-1] ^= 0x01
+    with pytest.raises(EncryptionError):
+        svc.decrypt(base64.urlsafe_b64encode(bytes(blob)).decode("ascii"))
@@ -1,11 +1,10 @@
 """Fixtures for workflow tests."""
 
-from unittest.mock import AsyncMock
-
 import pytest
 
 from app.governance.audit_logger import AuditLogger
 from app.workflows.langgraph.state_models import ComplianceState, RiskState
+from tests.helpers.audit import InMemoryAuditRepository
 
 
 def _base_risk_state(
@@ -46,9 +45,7 @@ def _base_compliance_state(
 
 @pytest.fixture
 def audit_repository():
-    repo = AsyncMock()
-    repo.save = AsyncMock(return_value=None)
-    return repo
+    return InMemoryAuditRepository()
 
 
 @pytest.fixture
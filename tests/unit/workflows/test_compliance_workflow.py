@@ -95,3 +95,115 @@ async def test_compliance_idempotency_skip(audit_logger):
     assert out.final_decision == "APPROVED"
     store.get_compliance_state.assert_awaited_once_with("e4")
     store.set_compliance_state.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_compliance_parallel_prefix_merges_results_in_order(audit_logger):
+    """Retrieval, policy and scoring run concurrently; merged state has all outputs and ordered trail."""
+    workflow = ComplianceWorkflow(audit_logger=audit_logger, state_store=None)
+    state = ComplianceState(
+        event_id="e5",
+        tenant_id="t1",
+        correlation_id="c5",
+        raw_event={"event_type": "high_risk", "metadata": {"category": "sensitive"}},
+        audit_trail=[],
+    )
+    out = await workflow.run(state)
+    assert out.retrieved_context == "simulated_context:t1:high_risk"
+    assert out.policy_result == "FAIL"
+    assert out.risk_score == 85.0
+    assert [e["node"] for e in out.audit_trail] == [
+        "retrieval",
+        "policy_validation",
+        "risk_scoring",
+        "guardrails",
+        "decision",
+    ]
+    assert state.audit_trail == []
+
+
+@pytest.mark.asyncio
+async def test_compliance_resume_skips_completed_parallel_nodes(audit_logger, audit_repository):
+    """Nodes already in the trail are not re-run when resuming a partial state."""
+    workflow = ComplianceWorkflow(audit_logger=audit_logger, state_store=None)
+    state = ComplianceState(
+        event_id="e6",
+        tenant_id="t1",
+        correlation_id="c6",
+        raw_event={"event_type": "low_risk"},
+        retrieved_context="ctx",
+        audit_trail=[{"node": "retrieval"}],
+    )
+    out = await workflow.run(state)
+    assert out.retrieved_context == "ctx"
+    assert [e["node"] for e in out.audit_trail].count("retrieval") == 1
+    assert len(audit_repository.save_many_calls) == 1
+    assert len(audit_repository.save_many_calls[-1]) == 4
+
+
+@pytest.mark.asyncio
+async def test_compliance_audit_written_in_one_bulk_call(audit_logger, audit_repository):
+    """All five node audit records are flushed together after the nodes run."""
+    workflow = ComplianceWorkflow(audit_logger=audit_logger, state_store=None)
+    state = ComplianceState(
+        event_id="e7", tenant_id="t1", correlation_id="c7", raw_event={"event_type": "standard"}
+    )
+    await workflow.run(state)
+    assert not audit_repository.save_calls
+    assert len(audit_repository.save_many_calls) == 1
+    records = audit_repository.save_many_calls[-1]
+    assert [r.action for r in records] == [
+        "context_retrieved",
+        "policy_validated",
+        "risk_scored",
+        "guardrails_applied",
+        "decision_made",
+    ]
+    assert all(r.tenant_id == "t1" and r.correlation_id == "c7" for r in records)
+
+
+@pytest.mark.asyncio
+async def test_compliance_registry_versions_cached_within_ttl(audit_logger):
+    """Registry lookups run once per TTL window; resolved versions land on the state."""
+    model_registry = AsyncMock()
+    model_registry.get_model = AsyncMock(
+        return_value=type("Rec", (), {"model_name": "compliance-model", "version": "2"})()
+    )
+    workflow = ComplianceWorkflow(audit_logger=audit_logger, model_registry=model_registry)
+    for i in range(3):
+        out = await workflow.run(
+            ComplianceState(
+                event_id=f"ev-ttl-{i}",
+                tenant_id="t1",
+                correlation_id=f"c-ttl-{i}",
+                raw_event={"event_type": "standard"},
+            )
+        )
+        assert out.model_version == "compliance-model@2"
+    assert model_registry.get_model.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_compliance_audit_sampler_keeps_decision_only_for_unsampled_approvals(
+    audit_logger, audit_repository
+):
+    """Unsampled APPROVED runs keep only the decision record; escalations stay fully audited."""
+    workflow = ComplianceWorkflow(audit_logger=audit_logger, audit_sampler=lambda s: False)
+    await workflow.run(
+        ComplianceState(
+            event_id="e8", tenant_id="t1", correlation_id="c8", raw_event={"event_type": "standard"}
+        )
+    )
+    records = audit_repository.save_many_calls[-1]
+    assert [r.action for r in records] == ["decision_made"]
+
+    await workflow.run(
+        ComplianceState(
+            event_id="e9",
+            tenant_id="t1",
+            correlation_id="c9",
+            raw_event={"event_type": "standard"},
+            regulatory_flags=["gdpr"],
+        )
+    )
+    assert len(audit_repository.save_many_calls[-1]) == 5
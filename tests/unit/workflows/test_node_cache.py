@@ -0,0 +1,96 @@
+"""Node cache tests: hits skip node body and audit, key includes versions and inputs, LRU bound,
+entries only cached once the audit batch is persisted."""
+
+import pytest
+
+from app.governance.audit_logger import AuditLogger
+from app.workflows.langgraph.compliance_workflow import ComplianceWorkflow
+from app.workflows.langgraph.node_cache import NodeCache
+from app.workflows.langgraph.nodes.risk_scoring import score_risk
+from app.workflows.langgraph.risk_workflow import RiskWorkflow
+from app.workflows.langgraph.state_models import ComplianceState, RiskState
+from tests.helpers.audit import InMemoryAuditRepository
+
+
+@pytest.mark.asyncio
+async def test_node_cache_hit_skips_node_and_audit(audit_logger, audit_repository):
+    cache = NodeCache()
+    state = RiskState(
+        event_id="e1", tenant_id="t1", correlation_id="c1", raw_event={"event_type": "high_risk"}
+    )
+    first = await cache.run("risk_scoring", score_risk, state, audit_logger=audit_logger)
+    second = await cache.run("risk_scoring", score_risk, state, audit_logger=audit_logger)
+    assert first.risk_score == second.risk_score == 85.0
+    assert len(audit_repository.save_calls) == 1
+    assert cache.hits == 1 and cache.misses == 1
+    assert second.audit_trail[-1]["node"] == "risk_scoring"
+    assert second.audit_trail[-1]["cached"] is True
+
+
+def test_node_cache_key_depends_on_inputs_and_versions():
+    base = RiskState(event_id="e1", tenant_id="t1", correlation_id="c1", raw_event={"a": 1})
+    key = NodeCache.key("risk_scoring", base)
+    assert NodeCache.key("risk_scoring", base.transition(correlation_id="c2")) == key
+    assert NodeCache.key("risk_scoring", base.transition(raw_event={"a": 2})) != key
+    assert NodeCache.key("risk_scoring", base.transition(model_version="m@2")) != key
+    assert NodeCache.key("policy_validation", base) != key
+
+
+@pytest.mark.asyncio
+async def test_node_cache_shared_across_workflow_replays(audit_logger, audit_repository):
+    cache = NodeCache(maxsize=16)
+    risk = RiskWorkflow(audit_logger=audit_logger, node_cache=cache)
+    compliance = ComplianceWorkflow(audit_logger=audit_logger, node_cache=cache)
+    r_state = RiskState(event_id="r1", tenant_id="t1", correlation_id="c1", raw_event={"event_type": "standard"})
+    c_state = ComplianceState(event_id="c1", tenant_id="t1", correlation_id="c1", raw_event={"event_type": "standard"})
+    out1 = await risk.run(r_state)
+    out2 = await risk.run(r_state)
+    await compliance.run(c_state)
+    await compliance.run(c_state)
+    assert out1.final_decision == out2.final_decision == "APPROVED"
+    # First run of each workflow writes one batch of 5; cached replays write nothing.
+    assert len(audit_repository.save_many_calls) == 2
+    assert all(len(c) == 5 for c in audit_repository.save_many_calls)
+    assert len(cache) == 10
+
+
+@pytest.mark.asyncio
+async def test_node_cache_evicts_least_recently_used(audit_logger):
+    cache = NodeCache(maxsize=2)
+    for i in range(3):
+        state = RiskState(event_id=f"e{i}", tenant_id="t1", correlation_id="c1")
+        await cache.run("risk_scoring", score_risk, state, audit_logger=audit_logger)
+    assert len(cache) == 2
+
+
+class _FlakyAuditRepository(InMemoryAuditRepository):
+    """save_many fails on its first call, then persists normally."""
+
+    __slots__ = ("failures",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.failures = 1
+
+    async def save_many(self, records):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("db down")
+        await super().save_many(records)
+
+
+@pytest.mark.asyncio
+async def test_node_cache_not_filled_when_audit_flush_fails():
+    """A retry after a failed audit flush reruns the nodes, so their records are written."""
+    repository = _FlakyAuditRepository()
+    cache = NodeCache()
+    workflow = RiskWorkflow(audit_logger=AuditLogger(repository=repository), node_cache=cache)
+    state = RiskState(event_id="e1", tenant_id="t1", correlation_id="c1", raw_event={"event_type": "standard"})
+    with pytest.raises(RuntimeError, match="db down"):
+        await workflow.run(state)
+    assert len(cache) == 0
+    out = await workflow.run(state)
+    assert out.final_decision == "APPROVED"
+    assert cache.hits == 0
+    assert len(repository.records) == 5
+    assert len(cache) == 5
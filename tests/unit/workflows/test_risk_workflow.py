@@ -101,15 +101,30 @@ async def test_risk_workflow_audit_trail_length(audit_logger):
         audit_trail=[],
     )
     out = await workflow.run(state)
-    nodes_in_trail = [e["node"] for e in out.audit_trail]
-    assert "retrieval" in nodes_in_trail
-    assert "policy_validation" in nodes_in_trail
-    assert "risk_scoring" in nodes_in_trail
-    assert "guardrails" in nodes_in_trail
-    assert "decision" in nodes_in_trail
+    assert out.completed_nodes == {
+        "retrieval",
+        "policy_validation",
+        "risk_scoring",
+        "guardrails",
+        "decision",
+    }
     assert len(out.audit_trail) == 5
 
 
+@pytest.mark.asyncio
+async def test_risk_workflow_trail_entries_share_request_timestamp(audit_logger):
+    """The trail timestamp is computed once per request and shared by every node entry."""
+    workflow = RiskWorkflow(audit_logger=audit_logger, state_store=None)
+    state = RiskState(
+        event_id="e5b",
+        tenant_id="t1",
+        correlation_id="c5b",
+        raw_event={"event_type": "standard"},
+    )
+    out = await workflow.run(state)
+    assert len({e["at"] for e in out.audit_trail}) == 1
+
+
 @pytest.mark.asyncio
 async def test_risk_workflow_stores_result_when_store_provided(audit_logger):
     """When state_store is provided, final state must be stored after run."""
@@ -130,3 +145,68 @@ async def test_risk_workflow_stores_result_when_store_provided(audit_logger):
     assert call_args[0][0] == "e6"
     assert call_args[0][1].event_id == "e6"
     assert call_args[0][1].final_decision == out.final_decision
+
+
+@pytest.mark.asyncio
+async def test_risk_workflow_audit_written_in_one_bulk_call(audit_logger, audit_repository):
+    """Node audit records are buffered per request and flushed in one bulk call."""
+    workflow = RiskWorkflow(audit_logger=audit_logger, state_store=None)
+    state = RiskState(
+        event_id="e8", tenant_id="t1", correlation_id="c8", raw_event={"event_type": "standard"}
+    )
+    await workflow.run(state)
+    assert not audit_repository.save_calls
+    assert len(audit_repository.save_many_calls) == 1
+    assert [r.action for r in audit_repository.save_many_calls[-1]] == [
+        "context_retrieved",
+        "policy_validated",
+        "risk_scored",
+        "guardrails_applied",
+        "decision_made",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_risk_registry_versions_fetched_once_for_concurrent_runs(audit_logger):
+    """Concurrent runs share one registry lookup; the result is reused within the TTL."""
+    import asyncio
+
+    model_registry = AsyncMock()
+    model_registry.get_model = AsyncMock(
+        return_value=type("Rec", (), {"model_name": "risk-model", "version": "3"})()
+    )
+    workflow = RiskWorkflow(audit_logger=audit_logger, model_registry=model_registry)
+    outs = await asyncio.gather(
+        *(
+            workflow.run(
+                RiskState(
+                    event_id=f"e-ttl-{i}",
+                    tenant_id="t1",
+                    correlation_id=f"c-ttl-{i}",
+                    raw_event={"event_type": "standard"},
+                )
+            )
+            for i in range(4)
+        )
+    )
+    assert {o.model_version for o in outs} == {"risk-model@3"}
+    assert model_registry.get_model.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_risk_pinned_versions_skip_registry(audit_logger):
+    """A state that already carries non-default versions keeps them; no registry lookup."""
+    model_registry = AsyncMock()
+    workflow = RiskWorkflow(audit_logger=audit_logger, model_registry=model_registry)
+    out = await workflow.run(
+        RiskState(
+            event_id="e-pinned",
+            tenant_id="t1",
+            correlation_id="c-pinned",
+            raw_event={"event_type": "standard"},
+            model_version="risk-model@2",
+            prompt_version=4,
+        )
+    )
+    assert (out.model_version, out.prompt_version) == ("risk-model@2", 4)
+    model_registry.get_model.assert_not_awaited()
@@ -1,9 +1,11 @@
 """State tests: immutable transitions, serialization."""
 
+import copy
 import json
 
 import pytest
 
+from app.workflows.langgraph.nodes.common import DECISION_APPROVED, POLICY_PASS
 from app.workflows.langgraph.state_models import ComplianceState, RiskState
 
 
@@ -86,3 +88,77 @@ def test_compliance_state_serialization_roundtrip():
     restored = ComplianceState.model_validate_json(state.model_dump_json())
     assert restored.regulatory_flags == state.regulatory_flags
     assert restored.approval_required == state.approval_required
+
+
+def test_states_loaded_from_json_intern_result_fields():
+    """Result fields decoded from JSON are the interned constants, so == hits the identity path."""
+    payload = RiskState(
+        event_id="e1",
+        tenant_id="t1",
+        correlation_id="c1",
+        policy_result="PASS",
+        final_decision="APPROVED",
+    ).model_dump_json()
+    restored = RiskState.model_validate_json(payload)
+    assert restored.policy_result is POLICY_PASS
+    assert restored.final_decision is DECISION_APPROVED
+
+
+def test_append_audit_appends_without_mutating_original():
+    """append_audit returns a new state with one more entry; existing entries are shared."""
+    first = {"node": "retrieval"}
+    state = RiskState(event_id="e1", tenant_id="t1", correlation_id="c1", audit_trail=[first])
+    new_state = state.append_audit({"node": "policy_validation"}, policy_result="PASS")
+    assert [e["node"] for e in new_state.audit_trail] == ["retrieval", "policy_validation"]
+    assert new_state.policy_result == "PASS"
+    assert len(state.audit_trail) == 1
+    assert state.policy_result is None
+    assert new_state.audit_trail[0] is state.audit_trail[0]
+
+
+def test_completed_nodes_tracks_audit_trail():
+    """completed_nodes is derived from a given trail, extended by append_audit and survives JSON."""
+    state = RiskState(
+        event_id="e1", tenant_id="t1", correlation_id="c1", audit_trail=[{"node": "retrieval"}]
+    )
+    assert state.completed_nodes == frozenset({"retrieval"})
+    state = state.append_audit({"node": "policy_validation"})
+    assert state.completed_nodes == frozenset({"retrieval", "policy_validation"})
+    restored = RiskState.model_validate_json(state.model_dump_json())
+    assert restored.completed_nodes == state.completed_nodes
+    assert state.transition(audit_trail=[]).completed_nodes == frozenset()
+
+
+@pytest.mark.asyncio
+async def test_workflow_never_mutates_shared_nested_state(audit_logger):
+    """transition() shares nested values, so a full run must leave the input's nested data intact."""
+    from app.workflows.langgraph.risk_workflow import RiskWorkflow
+
+    state = RiskState(
+        event_id="e1",
+        tenant_id="t1",
+        correlation_id="c1",
+        raw_event={"event_type": "high_risk", "metadata": {"category": "sensitive"}},
+    )
+    snapshot = copy.deepcopy(state.model_dump())
+    out = await RiskWorkflow(audit_logger=audit_logger).run(state)
+    assert state.model_dump() == snapshot
+    assert out.raw_event is state.raw_event
+
+
+@pytest.mark.asyncio
+async def test_compliance_workflow_never_mutates_shared_nested_state(audit_logger):
+    """Same invariant for ComplianceState, whose transitions are shallow as well."""
+    from app.workflows.langgraph.compliance_workflow import ComplianceWorkflow
+
+    state = ComplianceState(
+        event_id="e1",
+        tenant_id="t1",
+        correlation_id="c1",
+        raw_event={"event_type": "standard", "metadata": {"blocked_pattern": True}},
+        regulatory_flags=["gdpr"],
+    )
+    snapshot = copy.deepcopy(state.model_dump())
+    out = await ComplianceWorkflow(audit_logger=audit_logger).run(state)
+    assert state.model_dump() == snapshot
+    assert out.raw_event is state.raw_event
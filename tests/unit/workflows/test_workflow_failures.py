@@ -24,9 +24,10 @@ async def test_node_failure_propagates(audit_logger):
 
 @pytest.mark.asyncio
 async def test_workflow_failure_propagates(audit_logger):
-    """If a node raises, workflow run must propagate the error."""
+    """If the audit write raises, workflow run must propagate the error."""
     failing_repo = AsyncMock()
     failing_repo.save = AsyncMock(side_effect=ValueError("audit error"))
+    failing_repo.save_many = AsyncMock(side_effect=ValueError("audit error"))
     failing_audit = AuditLogger(repository=failing_repo)
     workflow = RiskWorkflow(audit_logger=failing_audit, state_store=None)
     state = RiskState(
@@ -70,5 +71,5 @@ async def test_tenant_isolation_state_carries_tenant(audit_logger, audit_reposit
         audit_logger=audit_logger,
     )
     assert out.tenant_id == "tenant-alpha"
-    record = audit_repository.save.call_args[0][0]
+    record = audit_repository.save_calls[-1]
     assert record.tenant_id == "tenant-alpha"
@@ -4,12 +4,15 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from app.workflows.langgraph.state_models import RiskState
+from app.workflows.langgraph.state_models import ComplianceState, RiskState
 from app.workflows.langgraph.workflow_state_store import (
+    COMPRESS_MIN_CHARS,
+    LocalCachedStateStore,
     _risk_state_from_json,
     _risk_state_to_json,
     RedisWorkflowStateStore,
 )
+from tests.helpers.fake_redis import FakeRedis
 
 
 def test_risk_state_serialization_roundtrip():
@@ -32,20 +35,14 @@ def test_risk_state_serialization_roundtrip():
 @pytest.mark.asyncio
 async def test_redis_workflow_state_store_get_miss():
     """get_risk_state returns None when key not in Redis."""
-    redis = AsyncMock()
-    redis.get_cache = AsyncMock(return_value=None)
-    store = RedisWorkflowStateStore(redis)
-    out = await store.get_risk_state("evt-1")
-    assert out is None
-    redis.get_cache.assert_awaited_once_with("workflow:evt-1")
+    store = RedisWorkflowStateStore(FakeRedis())
+    assert await store.get_risk_state("evt-1") is None
 
 
 @pytest.mark.asyncio
 async def test_redis_workflow_state_store_set_then_get():
-    """set_risk_state then get_risk_state returns same state."""
-    redis = AsyncMock()
-    redis.get_cache = AsyncMock(return_value=None)
-    redis.set_cache = AsyncMock(return_value=None)
+    """set_risk_state then get_risk_state returns same state, stored under workflow:{event_id}."""
+    redis = FakeRedis()
     store = RedisWorkflowStateStore(redis)
     state = RiskState(
         event_id="evt-1",
@@ -54,9 +51,116 @@ async def test_redis_workflow_state_store_set_then_get():
         final_decision="APPROVED",
     )
     await store.set_risk_state("evt-1", state, ttl_seconds=600)
-    redis.set_cache.assert_awaited_once()
-    call = redis.set_cache.call_args
-    assert call[0][0] == "workflow:evt-1"
-    restored = _risk_state_from_json(call[0][1])
-    assert restored.event_id == state.event_id
-    assert restored.final_decision == state.final_decision
+    assert list(redis._store) == ["workflow:evt-1"]
+    assert await store.get_risk_state("evt-1") == state
+    assert await store.get_risk_states(["evt-1", "evt-2"]) == [state, None]
+
+
+def test_large_state_stored_compressed_and_plain_json_still_read():
+    """Large payloads are compressed behind a prefix; plain JSON (legacy) still loads."""
+    state = RiskState(
+        event_id="e1",
+        tenant_id="t1",
+        correlation_id="c1",
+        audit_trail=[{"node": f"n{i}", "at": "2025-01-01T00:00:00+00:00"} for i in range(40)],
+    )
+    plain = state.model_dump_json()
+    assert len(plain) >= COMPRESS_MIN_CHARS
+    stored = _risk_state_to_json(state)
+    assert stored.startswith("z1:")
+    assert len(stored) < len(plain)
+    assert _risk_state_from_json(stored) == state
+    assert _risk_state_from_json(plain) == state
+
+
+@pytest.mark.asyncio
+async def test_redis_workflow_state_store_set_risk_states_single_call():
+    """set_risk_states writes every state through one set_cache_many call."""
+    redis = AsyncMock()
+    store = RedisWorkflowStateStore(redis)
+    states = [RiskState(event_id=f"evt-{i}", tenant_id="t1", correlation_id="c1") for i in range(3)]
+    await store.set_risk_states(states, ttl_seconds=600)
+    redis.set_cache_many.assert_awaited_once()
+    items = redis.set_cache_many.call_args[0][0]
+    assert list(items) == ["workflow:evt-0", "workflow:evt-1", "workflow:evt-2"]
+    assert _risk_state_from_json(items["workflow:evt-1"]).event_id == "evt-1"
+    assert redis.set_cache_many.call_args[1]["ttl"] == 600
+
+
+@pytest.mark.asyncio
+async def test_redis_workflow_state_store_get_risk_state_raw_returns_json():
+    """get_risk_state_raw returns the stored JSON (decompressed) without validation; None on miss."""
+    state = RiskState(
+        event_id="evt-1",
+        tenant_id="t1",
+        correlation_id="c1",
+        final_decision="APPROVED",
+        audit_trail=[{"node": f"n{i}", "at": "2025-01-01T00:00:00+00:00"} for i in range(40)],
+    )
+    redis = AsyncMock()
+    redis.get_cache = AsyncMock(return_value=_risk_state_to_json(state))
+    store = RedisWorkflowStateStore(redis)
+    raw = await store.get_risk_state_raw("evt-1")
+    assert raw == state.model_dump_json()
+    redis.get_cache = AsyncMock(return_value=None)
+    assert await store.get_risk_state_raw("evt-2") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_workflow_state_store_get_risk_states_single_mget():
+    """get_risk_states reads all keys with one MGET and keeps order, None for misses."""
+    state = RiskState(event_id="evt-1", tenant_id="t1", correlation_id="c1", final_decision="APPROVED")
+    redis = AsyncMock()
+    redis.mget_cache = AsyncMock(return_value=[_risk_state_to_json(state), None])
+    store = RedisWorkflowStateStore(redis)
+    out = await store.get_risk_states(["evt-1", "evt-2"])
+    redis.mget_cache.assert_awaited_once_with(["workflow:evt-1", "workflow:evt-2"])
+    assert out[0] == state
+    assert out[1] is None
+
+
+@pytest.mark.asyncio
+async def test_local_cached_state_store_skips_backend_on_repeat():
+    """Second lookup for an event_id is served locally; misses are not cached; TTL expires entries."""
+    state = RiskState(event_id="evt-1", tenant_id="t1", correlation_id="c1", final_decision="APPROVED")
+    inner = AsyncMock()
+    inner.get_risk_state = AsyncMock(side_effect=[None, state])
+    store = LocalCachedStateStore(inner)
+    assert await store.get_risk_state("evt-1") is None
+    assert await store.get_risk_state("evt-1") is state
+    assert await store.get_risk_state("evt-1") == state
+    assert inner.get_risk_state.await_count == 2
+
+    await store.set_risk_state("evt-2", state, ttl_seconds=600)
+    inner.set_risk_state.assert_awaited_once_with("evt-2", state, ttl_seconds=600)
+    assert await store.get_risk_state("evt-2") == state
+    assert inner.get_risk_state.await_count == 2
+
+    expiring = LocalCachedStateStore(inner, ttl_seconds=0)
+    await expiring.set_risk_state("evt-3", state)
+    assert len(expiring) == 1
+    inner.get_risk_state = AsyncMock(return_value=None)
+    assert await expiring.get_risk_state("evt-3") is None
+    assert len(expiring) == 0
+
+
+@pytest.mark.asyncio
+async def test_local_cached_state_store_hits_are_isolated_from_callers():
+    """Mutating a returned (or stored) state does not leak into later cache hits."""
+    state = ComplianceState(
+        event_id="evt-1",
+        tenant_id="t1",
+        correlation_id="c1",
+        raw_event={"event_type": "standard"},
+        audit_trail=[{"node": "decision"}],
+    )
+    store = LocalCachedStateStore(AsyncMock())
+    await store.set_compliance_state("evt-1", state)
+    state.raw_event["event_type"] = "changed"
+    first = await store.get_compliance_state("evt-1")
+    first.audit_trail.append({"node": "tampered"})
+    first.raw_event["event_type"] = "tampered"
+    second = await store.get_compliance_state("evt-1")
+    assert second is not first
+    assert second.raw_event == {"event_type": "standard"}
+    assert second.audit_trail == [{"node": "decision"}]